@@ -1,37 +1,47 @@
-import json
-
-def handler(request, context=None):
-    """Vercel serverless handler for health check"""
-    
-    # Handle CORS preflight requests
-    if request.method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'GET, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Content-Type': 'application/json'
-            },
-            'body': ''
-        }
-    
-    # Allow GET requests only
-    if request.method != 'GET':
-        return {
-            'statusCode': 405,
-            'body': json.dumps({'error': 'Method not allowed'}),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
-        }
-    
-    return {
-        'statusCode': 200,
-        'body': json.dumps({'status': 'healthy', 'service': 'comsof-validation'}),
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        }
-    }
\ No newline at end of file
+import os
+import sys
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from json_utils import dumps
+
+# Constant responses, serialized once at import
+_METHOD_NOT_ALLOWED = {
+    'statusCode': 405,
+    'body': dumps({'error': 'Method not allowed'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+_HEALTHY_RESPONSE = {
+    'statusCode': 200,
+    'body': dumps({'status': 'healthy', 'service': 'comsof-validation'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+
+def handler(request, context=None):
+    """Vercel serverless handler for health check"""
+    
+    # Handle CORS preflight requests
+    if request.method == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'GET, OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Content-Type': 'application/json'
+            },
+            'body': ''
+        }
+    
+    # Allow GET requests only
+    if request.method != 'GET':
+        return _METHOD_NOT_ALLOWED
+    
+    return _HEALTHY_RESPONSE
\ No newline at end of file
@@ -1,299 +1,272 @@
-import os
-import sys
-import zipfile
-import tempfile
-import shutil
-import io
-import json
-from datetime import datetime
-
-# Add parent directory to path to import modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from automation_for_app import (
-    check_osc_duplicates, check_invalid_cable_refs,
-    report_splice_counts_by_closure, process_shapefiles,
-    check_gistool_id, check_cluster_overlaps, check_granularity_fields, 
-    validate_non_virtual_closures, validate_feeder_primdistribution_locations,
-    validate_cable_diameters
-)
-
-from multipart_parser import parse_multipart_form
-
-# Reduced file size limit for serverless environment
-MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
-
-def extract_zip_from_bytes(zip_data):
-    """Extract zip file from bytes data and find the output directory"""
-    # Create a temporary directory
-    extract_dir = tempfile.mkdtemp()
-    
-    try:
-        # Write zip data to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_zip:
-            temp_zip.write(zip_data)
-            temp_zip_path = temp_zip.name
-        
-        # Extract zip file
-        with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        
-        # Clean up temp zip file
-        os.unlink(temp_zip_path)
-        
-        # Look for the output directory in the expected structure
-        base_dir = None
-        
-        # 1. Check for MRO_* directories
-        for name in os.listdir(extract_dir):
-            if name.startswith('MRO_') and os.path.isdir(os.path.join(extract_dir, name)):
-                base_dir = os.path.join(extract_dir, name)
-                break
-        
-        # 2. If no MRO_* directory found, check for output directly
-        if not base_dir:
-            base_dir = extract_dir
-        
-        # 3. Look for output directory
-        output_dir = os.path.join(base_dir, 'output')
-        if os.path.exists(output_dir) and os.path.isdir(output_dir):
-            return output_dir, extract_dir
-        
-        # 4. Fallback: check if any subdirectory contains OUT_Closures.shp
-        for root, dirs, files in os.walk(base_dir):
-            if 'OUT_Closures.shp' in files:
-                return root, extract_dir
-        
-        return None, extract_dir
-        
-    except Exception as e:
-        # Clean up on error
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir, ignore_errors=True)
-        raise e
-
-def handler(request, context=None):
-    """Vercel serverless handler for file validation"""
-    
-    # Get HTTP method - handle different request object types
-    method = getattr(request, 'method', 'GET')
-    if hasattr(request, 'environ'):
-        method = request.environ.get('REQUEST_METHOD', method)
-    
-    # Handle CORS preflight requests
-    if method == 'OPTIONS':
-        return {
-            'statusCode': 200,
-            'headers': {
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Methods': 'POST, OPTIONS',
-                'Access-Control-Allow-Headers': 'Content-Type',
-                'Content-Type': 'application/json'
-            },
-            'body': ''
-        }
-    
-    # Only allow POST requests
-    if method != 'POST':
-        return {
-            'statusCode': 405,
-            'body': json.dumps({'error': f'Method {method} not allowed. Only POST is supported.'}),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
-        }
-    
-    try:
-        # Get headers - handle different request object types
-        headers = getattr(request, 'headers', {})
-        if hasattr(request, 'environ'):
-            content_type = request.environ.get('CONTENT_TYPE', '')
-        else:
-            content_type = headers.get('content-type', headers.get('Content-Type', ''))
-        
-        if 'multipart/form-data' not in content_type:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': 'Invalid content type. Expected multipart/form-data'}),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        # Get request body - handle different request object types
-        body = None
-        if hasattr(request, 'body'):
-            body = request.body
-        elif hasattr(request, 'get_data'):
-            body = request.get_data()
-        elif hasattr(request, 'read'):
-            body = request.read()
-        
-        if not body:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': 'No request body found'}),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        # Parse multipart form data
-        try:
-            form_data = parse_multipart_form(body, content_type)
-        except Exception as e:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': f'Failed to parse form data: {str(e)}'}),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        # Extract file data
-        if 'file' not in form_data:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': 'No file uploaded'}),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        file_info = form_data['file']
-        filename = file_info.get('filename', 'unknown.zip')
-        file_data = file_info.get('data', b'')
-        
-        if not filename.endswith('.zip'):
-            return {
-                'statusCode': 400,
-                'body': json.dumps({'error': 'File must be a ZIP archive'}),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        file_size = len(file_data)
-        if file_size > MAX_FILE_SIZE:
-            return {
-                'statusCode': 413,
-                'body': json.dumps({
-                    'error': f'File too large ({file_size / (1024*1024):.1f}MB). Maximum size is 50MB for serverless deployment.'
-                }),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        # Extract checks data
-        checks_data = form_data.get('checks', '[]')
-        if isinstance(checks_data, bytes):
-            checks_data = checks_data.decode('utf-8')
-        
-        # Extract zip from memory
-        workspace, extract_dir = extract_zip_from_bytes(file_data)
-        
-        if not workspace:
-            # Generate directory tree for debugging
-            tree = []
-            for root, dirs, files in os.walk(extract_dir):
-                level = root.replace(extract_dir, '').count(os.sep)
-                indent = ' ' * 4 * level
-                tree.append(f'{indent}{os.path.basename(root)}/')
-                subindent = ' ' * 4 * (level + 1)
-                for f in files:
-                    tree.append(f'{subindent}{f}')
-            
-            # Cleanup
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            
-            return {
-                'statusCode': 400,
-                'body': json.dumps({
-                    'error': f"Could not find output folder in ZIP structure. Directory structure:\n{chr(10).join(tree)}"
-                }),
-                'headers': {
-                    'Content-Type': 'application/json',
-                    'Access-Control-Allow-Origin': '*'
-                }
-            }
-        
-        # Parse selected checks
-        try:
-            selected_checks = json.loads(checks_data)
-        except json.JSONDecodeError:
-            selected_checks = []
-        
-        # If no checks selected, use all checks as default
-        if not selected_checks:
-            selected_checks = [
-                "OSC Duplicates Check",
-                "Cluster Overlap Check",
-                "Cable Granularity Check",
-                "Non-virtual Closure Validation",
-                "Point Location Validation",
-                "Cable Diameter Validation",
-                "Cable Reference Validation",
-                "Shapefile Processing",
-                "GISTOOL_ID Validation",
-                "Splice Count Report"
-            ]
-        
-        # Mapping of check names to functions
-        CHECK_FUNCTIONS = {
-            "OSC Duplicates Check": check_osc_duplicates,
-            "Cluster Overlap Check": check_cluster_overlaps,
-            "Cable Granularity Check": check_granularity_fields,
-            "Non-virtual Closure Validation": validate_non_virtual_closures,
-            "Point Location Validation": validate_feeder_primdistribution_locations,
-            "Cable Diameter Validation": validate_cable_diameters,
-            "Cable Reference Validation": check_invalid_cable_refs,
-            "Shapefile Processing": process_shapefiles,
-            "GISTOOL_ID Validation": check_gistool_id,
-            "Splice Count Report": report_splice_counts_by_closure
-        }
-        
-        # Run only selected checks
-        results = []
-        for check_name in selected_checks:
-            if check_name in CHECK_FUNCTIONS:
-                try:
-                    check_func = CHECK_FUNCTIONS[check_name]
-                    status, message = check_func(workspace)
-                    results.append([check_name, status, message])
-                except Exception as e:
-                    results.append([check_name, None, f"Error running check: {str(e)}"])
-            else:
-                results.append([check_name, None, "Check function not found"])
-        
-        # Cleanup temporary files
-        shutil.rmtree(extract_dir, ignore_errors=True)
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'results': results,
-                'filename': filename
-            }),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
-        }
-        
-    except Exception as e:
-        return {
-            'statusCode': 500,
-            'body': json.dumps({'error': f'Processing error: {str(e)}'}),
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*'
-            }
-        }
\ No newline at end of file
+import os
+import sys
+import zipfile
+from werkzeug.formparser import parse_form_data
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multipart_parser import parse_multipart_form
+from json_utils import dumps, loads, JSONDecodeError
+from validation_core import (
+    MAX_FILE_SIZE, DEFAULT_CHECKS, payload_size, archive_tree, upload_digest,
+    get_cached_results, cache_results, cleanup_async, extract_zip_from_bytes, run_checks,
+    ArchiveTooLarge, use_zlib_ng
+)
+
+# This serverless function handles uploads, so let zipfile extract them with zlib-ng when it's there
+use_zlib_ng()
+
+def _parse_form_stream(environ):
+    """Parse a multipart body straight from the WSGI input stream.
+    
+    werkzeug spools large file parts to a temporary file, so the upload is never
+    held in memory as a whole body plus a copy of the file part.
+    """
+    _, form, files = parse_form_data(environ)
+    fields = dict(form.items())
+    for name, storage in files.items():
+        fields[name] = {
+            'filename': storage.filename,
+            'data': storage.stream,
+            'content_type': storage.content_type
+        }
+    return fields
+
+# Constant error responses, serialized once at import
+_INVALID_CONTENT_TYPE = {
+    'statusCode': 400,
+    'body': dumps({'error': 'Invalid content type. Expected multipart/form-data'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+_NO_REQUEST_BODY = {
+    'statusCode': 400,
+    'body': dumps({'error': 'No request body found'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+_NO_FILE_UPLOADED = {
+    'statusCode': 400,
+    'body': dumps({'error': 'No file uploaded'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+_NOT_A_ZIP = {
+    'statusCode': 400,
+    'body': dumps({'error': 'File must be a ZIP archive'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+_INVALID_ZIP = {
+    'statusCode': 400,
+    'body': dumps({'error': 'Uploaded file is not a valid ZIP archive'}),
+    'headers': {
+        'Content-Type': 'application/json',
+        'Access-Control-Allow-Origin': '*'
+    }
+}
+
+def handler(request, context=None):
+    """Vercel serverless handler for file validation"""
+    
+    # Get HTTP method - handle different request object types
+    method = getattr(request, 'method', 'GET')
+    if hasattr(request, 'environ'):
+        method = request.environ.get('REQUEST_METHOD', method)
+    
+    # Handle CORS preflight requests
+    if method == 'OPTIONS':
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Allow-Methods': 'POST, OPTIONS',
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Content-Type': 'application/json'
+            },
+            'body': ''
+        }
+    
+    # Only allow POST requests
+    if method != 'POST':
+        return {
+            'statusCode': 405,
+            'body': dumps({'error': f'Method {method} not allowed. Only POST is supported.'}),
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            }
+        }
+    
+    extract_dir = None
+    try:
+        # Get headers - handle different request object types
+        headers = getattr(request, 'headers', {})
+        if hasattr(request, 'environ'):
+            content_type = request.environ.get('CONTENT_TYPE', '')
+        else:
+            content_type = headers.get('content-type', headers.get('Content-Type', ''))
+        
+        if 'multipart/form-data' not in content_type:
+            return _INVALID_CONTENT_TYPE
+        
+        # WSGI requests are parsed from the input stream; other request types
+        # hand over the whole body, which goes through the in-memory parser
+        environ = getattr(request, 'environ', None)
+        
+        if environ is None:
+            # Get request body - handle different request object types
+            body = None
+            if hasattr(request, 'body'):
+                body = request.body
+            elif hasattr(request, 'get_data'):
+                body = request.get_data()
+            elif hasattr(request, 'read'):
+                body = request.read()
+            
+            if not body:
+                return _NO_REQUEST_BODY
+        
+        # Parse multipart form data
+        try:
+            if environ is not None:
+                form_data = _parse_form_stream(environ)
+            else:
+                form_data = parse_multipart_form(body, content_type)
+        except Exception as e:
+            return {
+                'statusCode': 400,
+                'body': dumps({'error': f'Failed to parse form data: {str(e)}'}),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                }
+            }
+        
+        # Extract file data
+        if 'file' not in form_data:
+            return _NO_FILE_UPLOADED
+        
+        file_info = form_data['file']
+        filename = file_info.get('filename', 'unknown.zip')
+        file_data = file_info.get('data', b'')
+        
+        if not filename.endswith('.zip'):
+            return _NOT_A_ZIP
+        
+        file_size = payload_size(file_data)
+        if file_size > MAX_FILE_SIZE:
+            return {
+                'statusCode': 413,
+                'body': dumps({
+                    'error': f'File too large ({file_size / (1024*1024):.1f}MB). Maximum size is 50MB for serverless deployment.'
+                }),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                }
+            }
+        
+        # Extract checks data
+        checks_data = form_data.get('checks', '[]')
+        if isinstance(checks_data, bytes):
+            checks_data = checks_data.decode('utf-8')
+        
+        # Parse selected checks
+        try:
+            selected_checks = loads(checks_data)
+        except JSONDecodeError:
+            selected_checks = []
+        
+        # If no checks selected, use all checks as default
+        if not selected_checks:
+            selected_checks = DEFAULT_CHECKS
+        
+        # Identical uploads reuse earlier results without extracting again
+        digest = upload_digest(file_data)
+        results = get_cached_results(digest, selected_checks)
+        if results is not None:
+            return {
+                'statusCode': 200,
+                'body': dumps({
+                    'results': results,
+                    'filename': filename
+                }),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                }
+            }
+        
+        # Extract zip from memory
+        try:
+            workspace, extract_dir = extract_zip_from_bytes(file_data)
+        except zipfile.BadZipFile:
+            # A corrupt or mislabelled upload is the client's error, not a server failure
+            return _INVALID_ZIP
+        except ArchiveTooLarge as e:
+            return {
+                'statusCode': 413,
+                'body': dumps({'error': str(e)}),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                }
+            }
+        
+        if not workspace:
+            # Generate directory tree for debugging
+            tree = archive_tree(file_data)
+            
+            return {
+                'statusCode': 400,
+                'body': dumps({
+                    'error': f"Could not find output folder in ZIP structure. Directory structure:\n{tree}"
+                }),
+                'headers': {
+                    'Content-Type': 'application/json',
+                    'Access-Control-Allow-Origin': '*'
+                }
+            }
+        
+        # Run only selected checks
+        results, completed = run_checks(workspace, selected_checks)
+        
+        # Remember the results so repeat uploads of this ZIP skip the checks
+        cache_results(digest, completed)
+        
+        return {
+            'statusCode': 200,
+            'body': dumps({
+                'results': results,
+                'filename': filename
+            }),
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            }
+        }
+        
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'body': dumps({'error': f'Processing error: {str(e)}'}),
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            }
+        }
+    
+    finally:
+        # Cleanup temporary files in the background, however the request ended
+        if extract_dir:
+            cleanup_async(extract_dir)
\ No newline at end of file
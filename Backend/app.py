@@ -1,87 +1,45 @@
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, send_file
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import RequestEntityTooLarge
 import os
-import zipfile
 import tempfile
-import shutil
-import io
-import json
+import zipfile
 from datetime import datetime
-from werkzeug.exceptions import RequestEntityTooLarge
 
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER
-from reportlab.lib import colors
-
-# Import your validation functions
-from automation_for_app import (
-    check_osc_duplicates, check_invalid_cable_refs,
-    report_splice_counts_by_closure, process_shapefiles,
-    check_gistool_id, check_cluster_overlaps, check_granularity_fields, 
-    validate_non_virtual_closures, validate_feeder_primdistribution_locations,
-    validate_cable_diameters
+from json_utils import orjson, loads, JSONDecodeError
+from validation_core import (
+    MAX_FILE_SIZE, DEFAULT_CHECKS, payload_size, archive_tree, upload_digest,
+    get_cached_results, cache_results, cleanup_async, extract_zip_from_bytes, run_checks,
+    ArchiveTooLarge, use_zlib_ng
 )
 
-# Note: You'll need to create this module separately
-from pdf_styles import get_pdf_styles
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson when it's installed"""
+    
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return loads(s)
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
-# Reduced file size limit for serverless environment
-MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB (Vercel has limits)
+# This process serves uploads, so let zipfile extract them with zlib-ng when it's there
+use_zlib_ng()
 
-def extract_zip_from_bytes(zip_data):
-    """Extract zip file from bytes data and find the output directory"""
-    # Create a temporary directory
-    extract_dir = tempfile.mkdtemp()
-    
-    try:
-        # Write zip data to temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as temp_zip:
-            temp_zip.write(zip_data)
-            temp_zip_path = temp_zip.name
-        
-        # Extract zip file
-        with zipfile.ZipFile(temp_zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        
-        # Clean up temp zip file
-        os.unlink(temp_zip_path)
-        
-        # Look for the output directory in the expected structure
-        base_dir = None
-        
-        # 1. Check for MRO_* directories
-        for name in os.listdir(extract_dir):
-            if name.startswith('MRO_') and os.path.isdir(os.path.join(extract_dir, name)):
-                base_dir = os.path.join(extract_dir, name)
-                break
-        
-        # 2. If no MRO_* directory found, check for output directly
-        if not base_dir:
-            base_dir = extract_dir
-        
-        # 3. Look for output directory
-        output_dir = os.path.join(base_dir, 'output')
-        if os.path.exists(output_dir) and os.path.isdir(output_dir):
-            return output_dir, extract_dir
-        
-        # 4. Fallback: check if any subdirectory contains OUT_Closures.shp
-        for root, dirs, files in os.walk(base_dir):
-            if 'OUT_Closures.shp' in files:
-                return root, extract_dir
-        
-        return None, extract_dir
-        
-    except Exception as e:
-        # Clean up on error
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir, ignore_errors=True)
-        raise e
+# Let werkzeug refuse oversized bodies from Content-Length before spooling them;
+# the margin leaves room for the multipart framing and form fields around the file
+app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE + 1024 * 1024
+
+# Generated PDFs larger than this spill from memory to a temporary file
+PDF_SPOOL_SIZE = 4 * 1024 * 1024  # 4MB
 
 def validate_handler():
     """Main validation handler"""
+    extract_dir = None
     try:
         # Check if file is in request
         if 'file' not in request.files:
@@ -94,95 +52,76 @@ def validate_handler():
         if not file.filename.endswith('.zip'):
             return jsonify({'error': 'File must be a ZIP archive'}), 400
         
-        # Read file data into memory
-        file_data = file.read()
-        file_size = len(file_data)
+        # Use werkzeug's spooled upload as-is rather than reading it into memory
+        file_data = file.stream
+        file_size = payload_size(file_data)
         
         if file_size > MAX_FILE_SIZE:
             return jsonify({
                 'error': f'File too large ({file_size / (1024*1024):.1f}MB). Maximum size is 50MB for serverless deployment.'
             }), 413
         
-        # Extract zip from memory
-        workspace, extract_dir = extract_zip_from_bytes(file_data)
-        
-        if not workspace:
-            # Generate directory tree for debugging
-            tree = []
-            for root, dirs, files in os.walk(extract_dir):
-                level = root.replace(extract_dir, '').count(os.sep)
-                indent = ' ' * 4 * level
-                tree.append(f'{indent}{os.path.basename(root)}/')
-                subindent = ' ' * 4 * (level + 1)
-                for f in files:
-                    tree.append(f'{subindent}{f}')
-            
-            # Cleanup
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            
-            return jsonify({
-                'error': f"Could not find output folder in ZIP structure. Directory structure:\n{chr(10).join(tree)}"
-            }), 400
-        
         # Get selected checks from form data
         checks_json = request.form.get('checks', '[]')
         try:
-            selected_checks = json.loads(checks_json)
-        except json.JSONDecodeError:
+            selected_checks = loads(checks_json)
+        except JSONDecodeError:
             selected_checks = []
         
         # If no checks selected, use all checks as default
         if not selected_checks:
-            selected_checks = [
-                "OSC Duplicates Check",
-                "Cluster Overlap Check",
-                "Cable Granularity Check",
-                "Non-virtual Closure Validation",
-                "Point Location Validation",
-                "Cable Diameter Validation",
-                "Cable Reference Validation",
-                "Shapefile Processing",
-                "GISTOOL_ID Validation",
-                "Splice Count Report"
-            ]
+            selected_checks = DEFAULT_CHECKS
         
-        # Mapping of check names to functions
-        CHECK_FUNCTIONS = {
-            "OSC Duplicates Check": check_osc_duplicates,
-            "Cluster Overlap Check": check_cluster_overlaps,
-            "Cable Granularity Check": check_granularity_fields,
-            "Non-virtual Closure Validation": validate_non_virtual_closures,
-            "Point Location Validation": validate_feeder_primdistribution_locations,
-            "Cable Diameter Validation": validate_cable_diameters,
-            "Cable Reference Validation": check_invalid_cable_refs,
-            "Shapefile Processing": process_shapefiles,
-            "GISTOOL_ID Validation": check_gistool_id,
-            "Splice Count Report": report_splice_counts_by_closure
-        }
+        # Identical uploads reuse earlier results without extracting again
+        digest = upload_digest(file_data)
+        results = get_cached_results(digest, selected_checks)
+        if results is not None:
+            return jsonify({
+                'results': results,
+                'filename': file.filename
+            })
+        
+        # Extract zip from memory
+        try:
+            workspace, extract_dir = extract_zip_from_bytes(file_data)
+        except zipfile.BadZipFile:
+            # A corrupt or mislabelled upload is the client's error, not a server failure
+            return jsonify({'error': 'Uploaded file is not a valid ZIP archive'}), 400
+        except ArchiveTooLarge as e:
+            return jsonify({'error': str(e)}), 413
+        
+        if not workspace:
+            # Generate directory tree for debugging
+            tree = archive_tree(file_data)
+            
+            return jsonify({
+                'error': f"Could not find output folder in ZIP structure. Directory structure:\n{tree}"
+            }), 400
         
         # Run only selected checks
-        results = []
-        for check_name in selected_checks:
-            if check_name in CHECK_FUNCTIONS:
-                try:
-                    check_func = CHECK_FUNCTIONS[check_name]
-                    status, message = check_func(workspace)
-                    results.append([check_name, status, message])
-                except Exception as e:
-                    results.append([check_name, None, f"Error running check: {str(e)}"])
-            else:
-                results.append([check_name, None, "Check function not found"])
+        results, completed = run_checks(workspace, selected_checks)
         
-        # Cleanup temporary files
-        shutil.rmtree(extract_dir, ignore_errors=True)
+        # Remember the results so repeat uploads of this ZIP skip the checks
+        cache_results(digest, completed)
         
         return jsonify({
             'results': results,
             'filename': file.filename
         })
         
+    except RequestEntityTooLarge:
+        body_size = (request.content_length or 0) / (1024*1024)
+        return jsonify({
+            'error': f'File too large ({body_size:.1f}MB). Maximum size is 50MB for serverless deployment.'
+        }), 413
+        
     except Exception as e:
         return jsonify({'error': f'Processing error: {str(e)}'}), 500
+    
+    finally:
+        # Cleanup temporary files in the background, however the request ended
+        if extract_dir:
+            cleanup_async(extract_dir)
 
 def export_pdf_handler():
     """PDF export handler"""
@@ -191,54 +130,27 @@ def export_pdf_handler():
         if not data or 'results' not in data:
             return jsonify({'error': 'Invalid export request'}), 400
         
-        # Get basic styles
-        styles = get_pdf_styles()
-        
-        # Create PDF in memory
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        elements = []
-        
-        # Title and metadata
-        elements.append(Paragraph("Comsof Validation Report", styles['title']))
-        elements.append(Spacer(1, 12))
-        elements.append(Paragraph(f"File: {data.get('filename', 'Unknown')}", styles['normal']))
-        elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['normal']))
-        elements.append(Spacer(1, 24))
-        
-        # Add section showing which checks were run
-        elements.append(Paragraph("Checks Performed:", styles['heading2']))
-        checks_run = [result[0] for result in data['results']]
-        checks_text = ", ".join(checks_run)
-        elements.append(Paragraph(checks_text, styles['normal']))
-        elements.append(Spacer(1, 24))
+        # reportlab is only needed for exports, so it's imported on demand
+        from pdf_styles import build_report
         
-        # Add detailed results
-        elements.append(Paragraph("Detailed Results", styles['section']))
+        # Read the clock once so the report and its filename share a timestamp
+        now = datetime.now()
         
-        for i, (name, status, message) in enumerate(data['results']):
-            # Add result header
-            status_text = "Passed" if status is False else "Failed" if status is True else "Error"
-            elements.append(Paragraph(f"{i+1}. {name} - {status_text}", styles['result_title']))
-            
-            # Clean and format message
-            clean_message = message.replace('\n', '<br/>')
-            elements.append(Paragraph(clean_message, styles['normal']))
-            
-            elements.append(Spacer(1, 12))
-        
-        # Generate PDF
-        doc.build(elements)
+        # Create PDF in a spooled file so large reports don't stay in memory
+        buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+        build_report(buffer, data, now)
         buffer.seek(0)
         
         # Prepare response
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         filename = f"validation_report_{data.get('filename', timestamp).replace('.zip', '')}.pdf"
         
-        return Response(
-            buffer.getvalue(),
+        # send_file streams the spooled file and closes it once the response is sent
+        return send_file(
+            buffer,
             mimetype="application/pdf",
-            headers={"Content-Disposition": f"attachment;filename={filename}"}
+            as_attachment=True,
+            download_name=filename
         )
         
     except Exception as e:
@@ -248,24 +160,51 @@ def health_handler():
     """Health check handler"""
     return jsonify({'status': 'healthy'})
 
-# Main handler function for Vercel
-def handler(request):
-    """Main serverless handler for Vercel"""
-    with app.test_request_context(
+# Dispatch table for the serverless handler, keyed by (method, path)
+ROUTES = {
+    ('POST', '/api/validate'): validate_handler,
+    ('POST', '/api/export-pdf'): export_pdf_handler,
+    ('GET', '/api/health'): health_handler,
+}
+
+# Register the same table as URL rules so app:app also serves it under a WSGI server
+for (method, path), view in ROUTES.items():
+    app.add_url_rule(path, view_func=view, methods=[method])
+
+def _request_context(request):
+    """Return a Flask request context for the incoming request"""
+    # WSGI requests already carry an environ Flask can use as-is; only rebuild
+    # one through the test request builder when there isn't one
+    environ = getattr(request, 'environ', None)
+    if environ is not None:
+        return app.request_context(environ)
+    return app.test_request_context(
         path=request.url.path,
         method=request.method,
         headers=request.headers,
         data=request.get_data(),
         query_string=request.url.query
-    ):
+    )
+
+# Main handler function for Vercel
+def handler(request):
+    """Main serverless handler for Vercel"""
+    # Resolve the route first so unknown endpoints don't pay for a request context
+    route = ROUTES.get((request.method, request.url.path))
+    if route is None:
+        return Response('{"error": "Endpoint not found"}', status=404, mimetype='application/json')
+    
+    with _request_context(request):
         try:
-            if request.method == 'POST' and request.url.path == '/api/validate':
-                return validate_handler()
-            elif request.method == 'POST' and request.url.path == '/api/export-pdf':
-                return export_pdf_handler()
-            elif request.method == 'GET' and request.url.path == '/api/health':
-                return health_handler()
-            else:
-                return jsonify({'error': 'Endpoint not found'}), 404
+            return route()
         except Exception as e:
-            return jsonify({'error': f'Server error: {str(e)}'}), 500
\ No newline at end of file
+            return jsonify({'error': f'Server error: {str(e)}'}), 500
+
+if __name__ == '__main__':
+    # Local development only; production runs app:app under gunicorn (config/render.yaml).
+    # Debug mode adds the reloader and debugger, so it's opt-in
+    app.run(
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        debug=os.environ.get('FLASK_DEBUG') == '1'
+    )
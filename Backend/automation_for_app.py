@@ -1,39 +1,155 @@
 import geopandas as gpd
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import pyogrio
+import pyogrio.raw
+import shapely
+from pandas.api.types import is_integer_dtype
+
+try:
+    # Imported only to probe that pyarrow is installed, which pyogrio's Arrow read path needs
+    import pyarrow  # noqa: F401
+    _USE_ARROW = True
+except ImportError:
+    _USE_ARROW = False
 
 __all__ = ['check_osc_duplicates', 'check_invalid_cable_refs', 'report_splice_counts_by_closure', 'process_shapefiles', 'check_gistool_id', 
-           'check_cluster_overlaps', 'check_granularity_fields', 'validate_non_virtual_closures', 'validate_feeder_primdistribution_locations','validate_cable_diameters']
+           'check_cluster_overlaps', 'check_granularity_fields', 'validate_non_virtual_closures', 'validate_feeder_primdistribution_locations','validate_cable_diameters', 'ShapefileCache']
 
 
 
 ###############################################################################################################
 
+def _read(path, columns, geometry=False, cache=None):
+    """
+    Reads only the given attribute columns of a shapefile, plus the geometry when asked.
+    Columns missing from the file are left out, so callers can still report them.
+    """
+    if cache is not None:
+        return cache.read(path, columns, geometry)
+    return gpd.read_file(path, engine="pyogrio", use_arrow=_USE_ARROW,
+                         columns=columns, read_geometry=geometry)
+
+
+def _map_layers(check_layer, layers):
+    """
+    Runs check_layer on every layer in its own thread and yields the results in layer order.
+    Reads and GEOS predicates release the GIL, so independent layers overlap.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(layers), 1)) as executor:
+        yield from executor.map(check_layer, layers)
+
+
+def _has_file(path, cache=None):
+    """
+    Tells whether path is an existing file, answered from the cache's directory
+    listing when there is one so a run doesn't stat every layer separately.
+    """
+    if cache is not None:
+        return cache.has_file(path)
+    return os.path.isfile(path)
+
+
+class ShapefileCache:
+    """
+    Holds the columns read from each shapefile during one validation run, so checks
+    sharing a layer only read each column from disk once. Safe to share between the
+    threads running the checks; a layer's entry is dropped when its file's mtime changes.
+    """
+
+    def __init__(self):
+        self._layers = {}
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    def has_file(self, path):
+        """Checks path against one os.scandir listing of its folder, taken on first use"""
+        folder, name = os.path.split(os.path.abspath(path))
+        with self._lock:
+            listing = self._listings.get(folder)
+            if listing is None:
+                try:
+                    with os.scandir(folder) as entries:
+                        listing = frozenset(entry.name for entry in entries if entry.is_file())
+                except OSError:
+                    listing = frozenset()
+                self._listings[folder] = listing
+        return name in listing
+
+    def _layer(self, path):
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            layer = self._layers.get(path)
+            if layer is None or layer['mtime'] != mtime:
+                layer = self._layers[path] = {
+                    'mtime': mtime, 'lock': threading.Lock(), 'index': None,
+                    'requested': set(), 'columns': {}, 'geometry': None
+                }
+            return layer
+
+    def read(self, path, columns, geometry=False):
+        layer = self._layer(os.path.abspath(path))
+        # Checks wanting the same layer wait for one read rather than repeating it
+        with layer['lock']:
+            missing = [c for c in columns if c not in layer['requested']]
+            read_geometry = geometry and layer['geometry'] is None
+            if missing or read_geometry:
+                frame = _read(path, missing, read_geometry)
+                # A read where none of the columns exist comes back with an empty
+                # index, which mustn't replace the rows of the columns already held
+                if layer['index'] is None or len(frame.columns):
+                    layer['index'] = frame.index
+                layer['requested'].update(missing)
+                layer['columns'].update((c, frame[c]) for c in missing if c in frame.columns)
+                if read_geometry:
+                    layer['geometry'] = frame.geometry
+
+            data = {c: layer['columns'][c] for c in columns if c in layer['columns']}
+            if geometry:
+                return gpd.GeoDataFrame(data, index=layer['index'], geometry=layer['geometry'])
+            return pd.DataFrame(data, index=layer['index'])
+
+
+###############################################################################################################
 
-def check_osc_duplicates(workspace):
+
+def check_osc_duplicates(workspace, cache=None):
     output = []
     try:
         shapefile_path = os.path.join(workspace, "OUT_Closures.shp")
         
-        if not os.path.isfile(shapefile_path):
+        if not _has_file(shapefile_path, cache):
             output.append(f"⛔ Error: OUT_Closures.shp not found in workspace: {workspace}")
             return None, "\n".join(output)
 
-        gdf = gpd.read_file(shapefile_path)
+        gdf = _read(shapefile_path, ["LINKED_AGG"], cache=cache)
         
         if 'LINKED_AGG' not in gdf.columns:
             output.append("⛔ Error: 'LINKED_AGG' column not found in the shapefile")
             return None, "\n".join(output)
 
-        duplicates = gdf['LINKED_AGG'].duplicated(keep=False)
+        # A single hashing pass: factorize labels each row with its value's code,
+        # and bincount gives the number of rows per value
+        codes, uniques = pd.factorize(gdf['LINKED_AGG'], use_na_sentinel=False)
+        counts = np.bincount(codes)
+        duplicated_values = counts > 1
+        duplicates = duplicated_values[codes]
         
         if duplicates.any():
             output.append("\n⚠️  We have a problem of duplicated OSCs! ⚠️")
             output.append(f"Total duplicated entries: {duplicates.sum()}")
             
-            duplicates_df = gdf[duplicates]['LINKED_AGG'].value_counts().reset_index()
-            duplicates_df.columns = ['OSC Value', 'Duplicate Count']
+            duplicates_df = pd.DataFrame({
+                'OSC Value': uniques[duplicated_values],
+                'Duplicate Count': counts[duplicated_values]
+            })
+            # Missing values count as duplicates above but aren't listed, as with value_counts
+            duplicates_df = duplicates_df[duplicates_df['OSC Value'].notna()]
+            duplicates_df = duplicates_df.sort_values('Duplicate Count', ascending=False, kind='stable')
             
             output.append("\nDuplicate occurrences:")
             output.append(duplicates_df.to_string(index=False))
@@ -49,25 +165,24 @@ def check_osc_duplicates(workspace):
 
  ##############################################################################################################   
 
-def process_shapefiles(workspace):
+def process_shapefiles(workspace, cache=None):
     """
     Checks feeder cables and closures without modifying files.
     Reports missing IDENTIFIERs in feeder cables and issues in non-virtual closures.
     Returns: (has_issues: bool, message: str)
     """
     import os
-    import geopandas as gpd
 
     output = ["🔍 Processing shapefiles: feeder cables and closures"]
     issues_found = False
     try:
         # Check FeederCables identifier issues without modifying
         feeder_path = os.path.join(workspace, "OUT_FeederCables.shp")
-        if not os.path.exists(feeder_path):
+        if not _has_file(feeder_path, cache):
             output.append(f"⛔ Error: OUT_FeederCables.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        feeder_gdf = gpd.read_file(feeder_path)
+        feeder_gdf = _read(feeder_path, ["IDENTIFIER"], cache=cache)
         if 'IDENTIFIER' not in feeder_gdf.columns:
             output.append("⚠️ Feeder cables: 'IDENTIFIER' column missing entirely")
             issues_found = True
@@ -87,11 +202,11 @@ def process_shapefiles(workspace):
 
         # Process Closures
         closures_path = os.path.join(workspace, "OUT_Closures.shp")
-        if not os.path.exists(closures_path):
+        if not _has_file(closures_path, cache):
             output.append(f"⛔ Error: OUT_Closures.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        closures_gdf = gpd.read_file(closures_path)
+        closures_gdf = _read(closures_path, ["IDENTIFIER", "VIRTUAL"], cache=cache)
 
         # Check required columns
         missing_cols = [col for col in ('IDENTIFIER', 'VIRTUAL') if col not in closures_gdf.columns]
@@ -104,9 +219,9 @@ def process_shapefiles(workspace):
             (closures_gdf['VIRTUAL'] == 0) &
             (closures_gdf['IDENTIFIER'].isna() | (closures_gdf['IDENTIFIER'] == ''))
         )
-        problem_closures = closures_gdf[mask]
-        if not problem_closures.empty:
-            count = len(problem_closures)
+        # Only the number of matches is reported, so count them without building the subset
+        count = int(mask.sum())
+        if count:
             output.append(f"⚠️ Problem found in closures: {count} non-virtual closures with empty IDENTIFIER")
             issues_found = True
         else:
@@ -122,15 +237,15 @@ def process_shapefiles(workspace):
 
 ###########################################################################################################
 
-def check_gistool_id(workspace):
+def check_gistool_id(workspace, cache=None):
     output = []
     try:
         seg_path = os.path.join(workspace, "OUT_UsedSegments.shp")
-        if not os.path.isfile(seg_path):
+        if not _has_file(seg_path, cache):
             output.append(f"⛔ Error: OUT_UsedSegments.shp not found in {workspace}")
             return None, "\n".join(output)
         
-        seg_gdf = gpd.read_file(seg_path)
+        seg_gdf = _read(seg_path, ["TYPE", "GISTOOL_ID", "ID"], cache=cache)
         
         required_cols = ['TYPE', 'GISTOOL_ID', 'ID']
         missing_cols = [col for col in required_cols if col not in seg_gdf.columns]
@@ -150,8 +265,10 @@ def check_gistool_id(workspace):
             output.append("GISTOOL_ID should be empty for aerial/buried segments:")
             output.append("Showing first 5 problematic segments:\n")
             
-            report = problem_segments[['TYPE', 'GISTOOL_ID', 'ID']].copy().head(5)
-            report['GISTOOL_ID'] = report['GISTOOL_ID'].apply(lambda x: f"'{x}'" if pd.notna(x) else '')
+            # Take the five rows first so only they are copied
+            report = problem_segments.head(5)[['TYPE', 'GISTOOL_ID', 'ID']].copy()
+            gistool_ids = report['GISTOOL_ID']
+            report['GISTOOL_ID'] = ("'" + gistool_ids.astype(str) + "'").where(gistool_ids.notna(), '')
             output.append(report[['TYPE', 'GISTOOL_ID', 'ID']].to_string(index=False))
             
             return True, "\n".join(output)
@@ -166,7 +283,40 @@ def check_gistool_id(workspace):
 
 
 ############################################################################################################
-def check_invalid_cable_refs(workspace):
+def _check_cable_refs_layer(workspace, layer, cache):
+    """Checks one cable type's pieces; returns (output lines, has_issues)"""
+    output = []
+    cable_file = f"OUT_{layer}Cables.shp"
+    piece_file = f"OUT_{layer}CablePieces.shp"
+    cable_path = os.path.join(workspace, cable_file)
+    piece_path = os.path.join(workspace, piece_file)
+
+    if not _has_file(cable_path, cache):
+        return [f"⚠️ Cable file missing: {cable_file}"], False
+    if not _has_file(piece_path, cache):
+        return [f"⚠️ Cable piece file missing: {piece_file}"], False
+
+    cables = _read(cable_path, ["CABLE_ID"], cache=cache)
+    pieces = _read(piece_path, ["CABLE_ID"], cache=cache)
+
+    # Check for invalid CableID references; isin hashes the column in C,
+    # with no Python set built from it first
+    invalid_pieces = pieces[~pieces["CABLE_ID"].isin(cables["CABLE_ID"].to_numpy())]
+
+    has_issues = not invalid_pieces.empty
+    if not has_issues:
+        output.append(f"✅ {layer}CablePieces: All CABLE_IDs are valid.")
+    else:
+        invalid_count = len(invalid_pieces)
+        invalid_ids = pd.unique(invalid_pieces["CABLE_ID"].to_numpy())
+        output.append(f"❌ {layer}CablePieces: Found {invalid_count} pieces with {len(invalid_ids)} invalid CableIDs")
+        output.append("Invalid CableIDs: " + ", ".join(invalid_ids[:10].astype(str)))
+        if len(invalid_ids) > 10:
+            output.append(f"Showing first 10 of {len(invalid_ids)} invalid IDs")
+    output.append("-" * 60)
+    return output, has_issues
+
+def check_invalid_cable_refs(workspace, cache=None):
     """
     Checks all cable piece shapefiles for invalid CableID references
     Returns: (has_issues, message) tuple
@@ -178,37 +328,10 @@ def check_invalid_cable_refs(workspace):
         cable_types = ["Feeder", "Drop", "PrimDistribution", "Distribution"]
         output.append("🔍 Checking CableID references for all cable types")
 
-        for layer in cable_types:
-            cable_file = f"OUT_{layer}Cables.shp"
-            piece_file = f"OUT_{layer}CablePieces.shp"
-            cable_path = os.path.join(workspace, cable_file)
-            piece_path = os.path.join(workspace, piece_file)
-
-            if not os.path.exists(cable_path):
-                output.append(f"⚠️ Cable file missing: {cable_file}")
-                continue
-            if not os.path.exists(piece_path):
-                output.append(f"⚠️ Cable piece file missing: {piece_file}")
-                continue
-
-            cables = gpd.read_file(cable_path)
-            pieces = gpd.read_file(piece_path)
-
-            # Check for invalid CableID references
-            valid_ids = set(cables["CABLE_ID"])
-            invalid_pieces = pieces[~pieces["CABLE_ID"].isin(valid_ids)]
-
-            if invalid_pieces.empty:
-                output.append(f"✅ {layer}CablePieces: All CABLE_IDs are valid.")
-            else:
-                has_issues = True
-                invalid_count = len(invalid_pieces)
-                invalid_ids = invalid_pieces["CABLE_ID"].unique()
-                output.append(f"❌ {layer}CablePieces: Found {invalid_count} pieces with {len(invalid_ids)} invalid CableIDs")
-                output.append("Invalid CableIDs: " + ", ".join(map(str, invalid_ids[:10])))
-                if len(invalid_ids) > 10:
-                    output.append(f"Showing first 10 of {len(invalid_ids)} invalid IDs")
-            output.append("-" * 60)
+        check_layer = lambda layer: _check_cable_refs_layer(workspace, layer, cache)
+        for lines, layer_issues in _map_layers(check_layer, cable_types):
+            output.extend(lines)
+            has_issues = has_issues or layer_issues
         
         return has_issues, "\n".join(output)
         
@@ -220,7 +343,7 @@ def check_invalid_cable_refs(workspace):
 
 #############################################################################################################
 
-def report_splice_counts_by_closure(workspace):
+def report_splice_counts_by_closure(workspace, cache=None):
     """
     Reports the number of splices per closure
     Returns: (is_report, message) tuple (status always False for reports)
@@ -242,57 +365,53 @@ def report_splice_counts_by_closure(workspace):
         splice_file = os.path.join(workspace, "OUT_Splices.shp")
         output.append("🔍 Reporting splices per closure type")
         
-        if not os.path.exists(closure_file):
+        if not _has_file(closure_file, cache):
             output.append("❌ Missing file: OUT_Closures.shp")
             return None, "\n".join(output)
-        if not os.path.exists(splice_file):
+        if not _has_file(splice_file, cache):
             output.append("❌ Missing file: OUT_Splices.shp")
             return None, "\n".join(output)
         
-        closures = gpd.read_file(closure_file)
-        splices = gpd.read_file(splice_file)
-        
-        # Count splices per closure ID
-        splice_counts = splices["ID"].value_counts().reset_index()
-        splice_counts.columns = ["ID", "SpliceCount"]
-        
-        # Merge counts into closures
-        closures["ID"] = closures["ID"].astype(str)
-        splice_counts["ID"] = splice_counts["ID"].astype(str)
-        
-        report_df = closures[["IDENTIFIER", "ID"]].copy()
-        report_df = report_df.merge(splice_counts, on="ID", how="left")
-        report_df["SpliceCount"] = report_df["SpliceCount"].fillna(0).astype(int)
-        
-        # Find closures that exceed their maximum splice count
-        problematic_closures = []
-        
-        for _, row in report_df.iterrows():
-            identifier = row['IDENTIFIER'] if pd.notnull(row['IDENTIFIER']) else 'N/A'
-            closure_id = str(row['ID']) if pd.notnull(row['ID']) else 'N/A'
-            splice_count = row['SpliceCount']
-            
-            # Check if this closure type has a defined limit
-            if identifier in MAX_SPLICE_LIMITS:
-                max_limit = MAX_SPLICE_LIMITS[identifier]
-                if splice_count > max_limit:
-                    problematic_closures.append({
-                        'identifier': identifier,
-                        'closure_id': closure_id,
-                        'splice_count': splice_count,
-                        'max_limit': max_limit
-                    })
+        closures = _read(closure_file, ["IDENTIFIER", "ID"], cache=cache)
+        splices = _read(splice_file, ["ID"], cache=cache)
+        
+        # Integer IDs are matched as they are; anything else is matched on its
+        # text form so IDs stored with different field types still line up
+        closure_ids = closures["ID"]
+        splice_ids = splices["ID"].dropna()
+        if not (is_integer_dtype(closure_ids) and is_integer_dtype(splice_ids)):
+            closure_ids = closure_ids.astype(str)
+            splice_ids = splice_ids.astype(str)
+        
+        # Count splices per closure ID and look the counts up for each closure
+        splice_counts = splice_ids.groupby(splice_ids, sort=False).size()
+        report_df = pd.DataFrame({
+            "IDENTIFIER": closures["IDENTIFIER"],
+            "ID": closure_ids,
+            "SpliceCount": closure_ids.map(splice_counts).fillna(0).astype(int)
+        })
+        
+        # Find closures that exceed their maximum splice count; closure types
+        # without a defined limit map to NaN, which never compares greater
+        limits = report_df["IDENTIFIER"].map(MAX_SPLICE_LIMITS)
+        over_limit = report_df["SpliceCount"] > limits
+        problematic = report_df[over_limit]
         
         # Report results
-        if problematic_closures:
+        if not problematic.empty:
             output.append(f"{'Closure Type':<30} {'Closure ID':<20} {'# Splices':<10} {'Message'}")
             output.append("-" * 100)
             
-            for closure in problematic_closures:
-                message = f"This closure exceeds the maximum number of splices which is {closure['max_limit']}"
-                output.append(f"{closure['identifier']:<30} {closure['closure_id']:<20} {closure['splice_count']:<10} {message}")
+            for identifier, closure_id, splice_count, max_limit in zip(
+                problematic["IDENTIFIER"].tolist(),
+                problematic["ID"].tolist(),
+                problematic["SpliceCount"].tolist(),
+                limits[over_limit].astype(int).tolist()
+            ):
+                message = f"This closure exceeds the maximum number of splices which is {max_limit}"
+                output.append(f"{identifier:<30} {closure_id:<20} {splice_count:<10} {message}")
             
-            output.append(f"\n❌ Found {len(problematic_closures)} closure(s) exceeding splice limits.")
+            output.append(f"\n❌ Found {len(problematic)} closure(s) exceeding splice limits.")
             return False, "\n".join(output)  # Always False status for reports
         else:
             output.append("✅ All closures are within their maximum splice limits.")
@@ -305,14 +424,45 @@ def report_splice_counts_by_closure(workspace):
 
 #################################################################################################
 
-def check_cluster_overlaps(workspace, cluster_files=None):
+def _check_cluster_overlaps_layer(workspace, file, cache):
+    """Checks one cluster shapefile for overlaps; returns (output lines, has_issues)"""
+    output = []
+    path = os.path.join(workspace, file)
+    if not _has_file(path, cache):
+        return [f"⚠️ File not found: {file}"], False
+
+    gdf = _read(path, ["CAB_GROUP", "AGG_ID"], geometry=True, cache=cache)
+    gdf = gdf[gdf.geometry.notnull()].reset_index(drop=True)
+
+    # One bulk spatial index query tests every feature at once; keeping
+    # left < right drops self-matches and reports each pair once
+    left, right = gdf.sindex.query(gdf.geometry, predicate="intersects")
+    mask = left < right
+    left, right = left[mask], right[mask]
+
+    if len(left):
+        output.append(f"❌ {file}: {len(left)} overlaps found:")
+        # Pull the ID column out once; rows without it are named by position
+        id_field = "CAB_GROUP" if "CableClusters" in file else "AGG_ID"
+        ids = gdf[id_field].to_numpy() if id_field in gdf.columns else None
+        for a, b in zip(left[:5].tolist(), right[:5].tolist()):
+            id_a = ids[a] if ids is not None else a
+            id_b = ids[b] if ids is not None else b
+            if id_field == "CAB_GROUP":
+                output.append(f"   • Cluster CAB_GROUP {id_a} overlaps with CAB_GROUP {id_b}")
+            else:
+                output.append(f"   • Cluster AGG_ID {id_a} overlaps with Cluster AGG_ID {id_b}")
+    else:
+        output.append(f"✅ {file}: No overlaps detected.")
+
+    output.append("-" * 60)
+    return output, bool(len(left))
+
+def check_cluster_overlaps(workspace, cluster_files=None, cache=None):
     """
     Detects overlapping features within each cluster layer shapefile.
     Returns: (has_issues: bool, message: str)
     """
-    import geopandas as gpd
-    import os
-
     output = ["🔍 Running cluster self-overlap checks...\n"]
     try:
         if cluster_files is None:
@@ -327,40 +477,10 @@ def check_cluster_overlaps(workspace, cluster_files=None):
             ]
 
         issues_found = False
-        for file in cluster_files:
-            path = os.path.join(workspace, file)
-            if not os.path.isfile(path):
-                output.append(f"⚠️ File not found: {file}")
-                continue
-
-            gdf = gpd.read_file(path)
-            gdf = gdf[gdf.geometry.notnull()].reset_index(drop=True)
-
-            overlaps = []
-            # spatial index for performance
-            sindex = gdf.sindex
-            for idx, geom in gdf.geometry.items():
-                candidates = sindex.query(geom, predicate="intersects")
-                for j in candidates:
-                    if idx < j and geom.intersects(gdf.geometry[j]):
-                        overlaps.append((idx, j))
-
-            if overlaps:
-                issues_found = True
-                output.append(f"❌ {file}: {len(overlaps)} overlaps found:")
-                for a, b in overlaps[:5]:
-                    if "CableClusters" in file:
-                        id_a = gdf.loc[a].get("CAB_GROUP", a)
-                        id_b = gdf.loc[b].get("CAB_GROUP", b)
-                        output.append(f"   • Cluster CAB_GROUP {id_a} overlaps with CAB_GROUP {id_b}")
-                    else:
-                        id_a = gdf.loc[a].get("AGG_ID", a)
-                        id_b = gdf.loc[b].get("AGG_ID", b)
-                        output.append(f"   • Cluster AGG_ID {id_a} overlaps with Cluster AGG_ID {id_b}")
-            else:
-                output.append(f"✅ {file}: No overlaps detected.")
-
-            output.append("-" * 60)
+        check_layer = lambda file: _check_cluster_overlaps_layer(workspace, file, cache)
+        for lines, layer_issues in _map_layers(check_layer, cluster_files):
+            output.extend(lines)
+            issues_found = issues_found or layer_issues
 
         return issues_found, "\n".join(output)
 
@@ -371,45 +491,46 @@ def check_cluster_overlaps(workspace, cluster_files=None):
 
 #################################################################################################
 
-def check_granularity_fields(workspace):
+def _check_granularity_layer(workspace, layer, cache):
+    """Checks one cable layer's granularity fields; returns (output lines, has_issues)"""
+    output = []
+    file_name = f"OUT_{layer}Cables.shp"
+    path = os.path.join(workspace, file_name)
+    if not _has_file(path, cache):
+        return [f"⚠️ Missing: {file_name}"], False
+
+    gdf = _read(path, ["CABLE_ID", "CABLEGRAN", "BUNDLEGRAN"], cache=cache)
+    if 'CABLEGRAN' not in gdf.columns or 'BUNDLEGRAN' not in gdf.columns:
+        return [f"❌ {file_name} is missing CABLEGRAN or BUNDLEGRAN fields."], True
+
+    invalid = gdf[(gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1)]
+    if not invalid.empty:
+        count = len(invalid)
+        output.append(f"❌ {file_name}: {count} invalid rows:")
+        # show up to 5 rows
+        preview = invalid[['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN']].head(5)
+        output.append(preview.to_string(index=False))
+    else:
+        output.append(f"✅ {file_name}: All granularity values are valid.")
+
+    output.append("-" * 60)
+    return output, not invalid.empty
+
+def check_granularity_fields(workspace, cache=None):
     """
     Validates that CABLEGRAN and BUNDLEGRAN fields are not set to -1 
     in all OUT_<Layer>Cables.shp files.
     Returns: (has_issues: bool, message: str)
     """
-    import geopandas as gpd
-    import os
-
     output = ["🔍 Checking CABLEGRAN and BUNDLEGRAN values in cable layers...\n"]
     try:
         cable_layers = ["Feeder", "Drop", "Distribution", "PrimDistribution"]
         issues_found = False
 
-        for layer in cable_layers:
-            file_name = f"OUT_{layer}Cables.shp"
-            path = os.path.join(workspace, file_name)
-            if not os.path.isfile(path):
-                output.append(f"⚠️ Missing: {file_name}")
-                continue
-
-            gdf = gpd.read_file(path)
-            if 'CABLEGRAN' not in gdf.columns or 'BUNDLEGRAN' not in gdf.columns:
-                output.append(f"❌ {file_name} is missing CABLEGRAN or BUNDLEGRAN fields.")
-                issues_found = True
-                continue
-
-            invalid = gdf[(gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1)]
-            if not invalid.empty:
-                issues_found = True
-                count = len(invalid)
-                output.append(f"❌ {file_name}: {count} invalid rows:")
-                # show up to 5 rows
-                preview = invalid[['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN']].head(5)
-                output.append(preview.to_string(index=False))
-            else:
-                output.append(f"✅ {file_name}: All granularity values are valid.")
-
-            output.append("-" * 60)
+        check_layer = lambda layer: _check_granularity_layer(workspace, layer, cache)
+        for lines, layer_issues in _map_layers(check_layer, cable_layers):
+            output.extend(lines)
+            issues_found = issues_found or layer_issues
 
         return issues_found, "\n".join(output)
 
@@ -423,7 +544,7 @@ def check_granularity_fields(workspace):
 
 ######################################################################################################
 
-def validate_non_virtual_closures(workspace):
+def validate_non_virtual_closures(workspace, cache=None):
     """
     Validates that PrimDistribution, Distribution, and Drop closures are not virtual.
     
@@ -440,11 +561,11 @@ def validate_non_virtual_closures(workspace):
     output = ["🔍 Validating non-virtual closures..."]
     try:
         closure_path = os.path.join(workspace, "OUT_Closures.shp")
-        if not os.path.isfile(closure_path):
+        if not _has_file(closure_path, cache):
             output.append(f"⛔ Error: OUT_Closures.shp not found in {workspace}")
             return None, "\n".join(output)
 
-        closures = gpd.read_file(closure_path)
+        closures = _read(closure_path, ["LAYER", "VIRTUAL", "EQ_ID"], cache=cache)
 
         # Check required columns
         required_cols = ['LAYER', 'VIRTUAL', 'EQ_ID']
@@ -485,7 +606,17 @@ def validate_non_virtual_closures(workspace):
 #######################################################################################################
 
 
-def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
+def _first_geometry(path):
+    """
+    Returns a shapefile's feature count and its first geometry, or None when it's empty.
+    The count comes from the layer header and only one record is read, with no DataFrame built.
+    """
+    count = pyogrio.read_info(path)["features"]
+    geometries = pyogrio.raw.read(path, columns=[], max_features=1)[2]
+    return count, (shapely.from_wkb(geometries[0]) if len(geometries) else None)
+
+
+def validate_feeder_primdistribution_locations(workspace, tolerance=0.01, cache=None):
     """
     Validates that Feeder Points and Primary Distribution Points are not co-located.
     
@@ -508,27 +639,24 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         output.append("\n🔍 Validating Feeder and Primary Distribution Point locations...")
         
         # Check if files exist
-        if not os.path.exists(feeder_path):
+        if not _has_file(feeder_path, cache):
             output.append("⛔ Error: OUT_FeederPoints.shp not found")
             return None, "\n".join(output)
-        if not os.path.exists(prim_path):
+        if not _has_file(prim_path, cache):
             output.append("⛔ Error: OUT_PrimDistributionPoints.shp not found")
             return None, "\n".join(output)
         
-        # Load shapefiles
-        feeder_points = gpd.read_file(feeder_path)
-        prim_points = gpd.read_file(prim_path)
+        # Load the feature count and first point of each shapefile
+        feeder_count, feeder_geom = _first_geometry(feeder_path)
+        prim_count, prim_geom = _first_geometry(prim_path)
         
         # Check if each file has exactly one point
-        if len(feeder_points) != 1:
-            output.append(f"⚠️ Warning: OUT_FeederPoints.shp has {len(feeder_points)} features (expected 1)")
-        if len(prim_points) != 1:
-            output.append(f"⚠️ Warning: OUT_PrimDistributionPoints.shp has {len(prim_points)} features (expected 1)")
-        
-        if len(feeder_points) > 0 and len(prim_points) > 0:
-            # Get the first point from each file
-            feeder_geom = feeder_points.geometry.iloc[0]
-            prim_geom = prim_points.geometry.iloc[0]
+        if feeder_count != 1:
+            output.append(f"⚠️ Warning: OUT_FeederPoints.shp has {feeder_count} features (expected 1)")
+        if prim_count != 1:
+            output.append(f"⚠️ Warning: OUT_PrimDistributionPoints.shp has {prim_count} features (expected 1)")
+        
+        if feeder_count > 0 and prim_count > 0:
             
             # Calculate distance between points
             distance = feeder_geom.distance(prim_geom)
@@ -558,7 +686,37 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         return None, "\n".join(output)
 
 #######################################################################################################
-def validate_cable_diameters(workspace):
+def _check_diameters_layer(workspace, file, cache):
+    """Checks one cable shapefile's diameters; returns (output lines, has_issues, has_errors)"""
+    output = []
+    file_path = os.path.join(workspace, file)
+    
+    if not _has_file(file_path, cache):
+        return [f"⛔ Error: {file} not found in workspace"], False, True
+        
+    gdf = _read(file_path, ["CABLE_ID", "DIAMETER"], cache=cache)
+    
+    if 'DIAMETER' not in gdf.columns:
+        return [f"⛔ Error: {file} is missing DIAMETER column"], False, True
+        
+    # Find invalid diameters (missing or zero)
+    invalid_mask = gdf['DIAMETER'].isna() | (gdf['DIAMETER'] == 0)
+    invalid_cables = gdf[invalid_mask]
+    
+    if not invalid_cables.empty:
+        output.append(f"\n❌ PROBLEM: Found {len(invalid_cables)} cables with invalid diameters in {file}")
+        output.append("Cables must have non-zero diameter values")
+        
+        # Show sample of problematic cables
+        sample = invalid_cables[['CABLE_ID', 'DIAMETER']].head(5)
+        output.append("\nSample of problematic cables:")
+        output.append(sample.to_string(index=False))
+        return output, True, True
+    
+    output.append(f"\n✅ {file}: All cables have valid diameters")
+    return output, False, False
+
+def validate_cable_diameters(workspace, cache=None):
     """
     Validates that DIAMETER column is not empty or zero in cable shapefiles.
     
@@ -582,39 +740,11 @@ def validate_cable_diameters(workspace):
         output.append("\n🔍 Validating cable diameters...")
         any_errors = False
         
-        for file in cable_files:
-            file_path = os.path.join(workspace, file)
-            file_errors = False
-            
-            if not os.path.exists(file_path):
-                output.append(f"⛔ Error: {file} not found in workspace")
-                any_errors = True
-                continue
-                
-            gdf = gpd.read_file(file_path)
-            
-            if 'DIAMETER' not in gdf.columns:
-                output.append(f"⛔ Error: {file} is missing DIAMETER column")
-                any_errors = True
-                continue
-                
-            # Find invalid diameters (missing or zero)
-            invalid_mask = gdf['DIAMETER'].isna() | (gdf['DIAMETER'] == 0)
-            invalid_cables = gdf[invalid_mask]
-            
-            if not invalid_cables.empty:
-                has_issues = True
-                file_errors = True
-                any_errors = True
-                output.append(f"\n❌ PROBLEM: Found {len(invalid_cables)} cables with invalid diameters in {file}")
-                output.append("Cables must have non-zero diameter values")
-                
-                # Show sample of problematic cables
-                sample = invalid_cables[['CABLE_ID', 'DIAMETER']].head(5)
-                output.append("\nSample of problematic cables:")
-                output.append(sample.to_string(index=False))
-            else:
-                output.append(f"\n✅ {file}: All cables have valid diameters")
+        check_layer = lambda file: _check_diameters_layer(workspace, file, cache)
+        for lines, file_issues, file_errors in _map_layers(check_layer, cable_files):
+            output.extend(lines)
+            has_issues = has_issues or file_issues
+            any_errors = any_errors or file_errors
         
         if not any_errors:
             output.append("\n✅ All cable files have valid diameter values")
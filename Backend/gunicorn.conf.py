@@ -0,0 +1,10 @@
+# gunicorn reads this file from the working directory on start-up (config/render.yaml)
+
+def on_starting(server):
+    """Load the validators, geopandas, pyogrio and GDAL's drivers once in the master.
+    
+    Workers forked afterwards inherit them and start warm. Importing app.py elsewhere
+    (Vercel, scripts, tooling) no longer pays for this.
+    """
+    from validation_core import preload_validators
+    preload_validators()
@@ -0,0 +1,23 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    # Fallback to the standard library if orjson isn't installed
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both
+JSONDecodeError = json.JSONDecodeError
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON from a str or bytes object"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
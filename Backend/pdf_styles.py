@@ -1,126 +1,63 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+
+# Escapes markup characters and turns line breaks (including lone \r) into <br/> in one pass
+_MESSAGE_MARKUP = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br/>', '\r': '<br/>'})
 
+# Report styles as (key, style name, base style, overrides), built by get_pdf_styles()
+_STYLE_SPECS = (
+    ('title', 'CustomTitle', 'Heading1', dict(
+        fontSize=20, spaceAfter=30, spaceBefore=0, alignment=TA_CENTER,
+        textColor=colors.darkblue, fontName='Helvetica-Bold')),
+    ('heading2', 'CustomHeading2', 'Heading2', dict(
+        fontSize=16, spaceAfter=18, spaceBefore=12,
+        textColor=colors.darkblue, fontName='Helvetica-Bold')),
+    ('section', 'CustomSection', 'Heading3', dict(
+        fontSize=14, spaceAfter=12, spaceBefore=12,
+        textColor=colors.darkred, fontName='Helvetica-Bold')),
+    ('normal', 'CustomNormal', 'Normal', dict(
+        fontSize=10, spaceAfter=6, spaceBefore=3, alignment=TA_LEFT,
+        fontName='Helvetica')),
+    ('result_title', 'ResultTitle', 'Normal', dict(
+        fontSize=12, spaceBefore=8, spaceAfter=4,
+        textColor=colors.darkgreen, fontName='Helvetica-Bold', leftIndent=0)),
+    ('passed', 'PassedResult', 'Normal', dict(
+        fontSize=10, spaceBefore=4, spaceAfter=6,
+        textColor=colors.darkgreen, fontName='Helvetica', leftIndent=20)),
+    ('failed', 'FailedResult', 'Normal', dict(
+        fontSize=10, spaceBefore=4, spaceAfter=6,
+        textColor=colors.darkred, fontName='Helvetica', leftIndent=20)),
+    ('error', 'ErrorResult', 'Normal', dict(
+        fontSize=10, spaceBefore=4, spaceAfter=6,
+        textColor=colors.red, fontName='Helvetica', leftIndent=20)),
+    ('metadata', 'Metadata', 'Normal', dict(
+        fontSize=10, spaceAfter=3, spaceBefore=1,
+        textColor=colors.grey, fontName='Helvetica', alignment=TA_LEFT)),
+    ('summary', 'Summary', 'Normal', dict(
+        fontSize=11, spaceAfter=8, spaceBefore=4, textColor=colors.black,
+        fontName='Helvetica', alignment=TA_JUSTIFY, leftIndent=10, rightIndent=10)),
+)
+
+@lru_cache(maxsize=1)
 def get_pdf_styles():
-    """Return custom PDF styles for the validation report"""
+    """Return custom PDF styles for the validation report, built once and shared read-only"""
     
     # Get base styles
     base_styles = getSampleStyleSheet()
     
     # Create custom styles dictionary
     styles = {
-        'title': ParagraphStyle(
-            'CustomTitle',
-            parent=base_styles['Heading1'],
-            fontSize=20,
-            spaceAfter=30,
-            spaceBefore=0,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue,
-            fontName='Helvetica-Bold'
-        ),
-        
-        'heading2': ParagraphStyle(
-            'CustomHeading2',
-            parent=base_styles['Heading2'],
-            fontSize=16,
-            spaceAfter=18,
-            spaceBefore=12,
-            textColor=colors.darkblue,
-            fontName='Helvetica-Bold'
-        ),
-        
-        'section': ParagraphStyle(
-            'CustomSection',
-            parent=base_styles['Heading3'],
-            fontSize=14,
-            spaceAfter=12,
-            spaceBefore=12,
-            textColor=colors.darkred,
-            fontName='Helvetica-Bold'
-        ),
-        
-        'normal': ParagraphStyle(
-            'CustomNormal',
-            parent=base_styles['Normal'],
-            fontSize=10,
-            spaceAfter=6,
-            spaceBefore=3,
-            alignment=TA_LEFT,
-            fontName='Helvetica'
-        ),
-        
-        'result_title': ParagraphStyle(
-            'ResultTitle',
-            parent=base_styles['Normal'],
-            fontSize=12,
-            spaceBefore=8,
-            spaceAfter=4,
-            textColor=colors.darkgreen,
-            fontName='Helvetica-Bold',
-            leftIndent=0
-        ),
-        
-        'passed': ParagraphStyle(
-            'PassedResult',
-            parent=base_styles['Normal'],
-            fontSize=10,
-            spaceBefore=4,
-            spaceAfter=6,
-            textColor=colors.darkgreen,
-            fontName='Helvetica',
-            leftIndent=20
-        ),
-        
-        'failed': ParagraphStyle(
-            'FailedResult',
-            parent=base_styles['Normal'],
-            fontSize=10,
-            spaceBefore=4,
-            spaceAfter=6,
-            textColor=colors.darkred,
-            fontName='Helvetica',
-            leftIndent=20
-        ),
-        
-        'error': ParagraphStyle(
-            'ErrorResult',
-            parent=base_styles['Normal'],
-            fontSize=10,
-            spaceBefore=4,
-            spaceAfter=6,
-            textColor=colors.red,
-            fontName='Helvetica',
-            leftIndent=20
-        ),
-        
-        'metadata': ParagraphStyle(
-            'Metadata',
-            parent=base_styles['Normal'],
-            fontSize=10,
-            spaceAfter=3,
-            spaceBefore=1,
-            textColor=colors.grey,
-            fontName='Helvetica',
-            alignment=TA_LEFT
-        ),
-        
-        'summary': ParagraphStyle(
-            'Summary',
-            parent=base_styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-            spaceBefore=4,
-            textColor=colors.black,
-            fontName='Helvetica',
-            alignment=TA_JUSTIFY,
-            leftIndent=10,
-            rightIndent=10
-        )
+        key: ParagraphStyle(name, parent=base_styles[parent], **overrides)
+        for key, name, parent, overrides in _STYLE_SPECS
     }
     
-    return styles
+    return MappingProxyType(styles)
 
 def get_status_style(status, styles):
     """Return appropriate style based on check status"""
@@ -131,25 +68,77 @@ def get_status_style(status, styles):
     else:  # Error/None
         return styles['error']
 
+def escape_markup(text):
+    """Escape text for a ReportLab Paragraph, keeping its line breaks"""
+    # Collapse Windows line endings so each counts as one break
+    return str(text).replace('\r\n', '\n').translate(_MESSAGE_MARKUP)
+
 def format_check_message(message, max_length=500):
-    """Format and truncate check messages for PDF display"""
+    """Format and truncate check messages for PDF display; max_length=None keeps all of it"""
     if not message:
         return "No message provided"
     
     # Convert to string and clean up
-    message = str(message)
-    
-    # Replace problematic characters
-    message = message.replace('\r\n', '\n').replace('\r', '\n')
+    message = str(message).replace('\r\n', '\n')
     
     # Truncate if too long
-    if len(message) > max_length:
+    if max_length is not None and len(message) > max_length:
         message = message[:max_length] + "... (truncated)"
     
     # Escape HTML-like characters but preserve line breaks
-    message = message.replace('&', '&amp;')
-    message = message.replace('<', '&lt;')
-    message = message.replace('>', '&gt;')
-    message = message.replace('\n', '<br/>')
+    return escape_markup(message)
+
+# Column widths of the results table, filling the letter page between margins
+_RESULT_COL_WIDTHS = (24, 130, 50, 264)
+
+@lru_cache(maxsize=1)
+def _results_table_style():
+    """Build the results table style once and reuse it across reports"""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+    ])
+
+def build_report(buffer, data, now):
+    """Write the validation report for an export request's data into buffer as a PDF"""
+    styles = get_pdf_styles()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    elements = []
+    
+    # Title and metadata
+    elements.append(Paragraph("Comsof Validation Report", styles['title']))
+    elements.append(Spacer(1, 12))
+    elements.append(Paragraph(f"File: {escape_markup(data.get('filename', 'Unknown'))}", styles['normal']))
+    elements.append(Paragraph(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}", styles['normal']))
+    elements.append(Spacer(1, 24))
+    
+    # Add section showing which checks were run
+    elements.append(Paragraph("Checks Performed:", styles['heading2']))
+    checks_run = [result[0] for result in data['results']]
+    elements.append(Paragraph(escape_markup(", ".join(checks_run)), styles['normal']))
+    elements.append(Spacer(1, 24))
+    
+    # Add detailed results
+    elements.append(Paragraph("Detailed Results", styles['section']))
+    
+    # One table for all results lays out far faster than 3 flowables per result
+    normal_style = styles['normal']
+    rows = [['#', 'Check', 'Status', 'Details']]
+    for i, (name, status, message) in enumerate(data['results'], 1):
+        status_text = "Passed" if status is False else "Failed" if status is True else "Error"
+        rows.append([
+            str(i),
+            Paragraph(escape_markup(name), normal_style),
+            status_text,
+            Paragraph(format_check_message(message, max_length=None), normal_style)
+        ])
+    
+    # splitInRow lets long messages continue onto the next page
+    table = Table(rows, colWidths=_RESULT_COL_WIDTHS, splitInRow=1)
+    table.setStyle(_results_table_style())
+    elements.append(table)
     
-    return message
\ No newline at end of file
+    doc.build(elements)
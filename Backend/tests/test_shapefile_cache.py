@@ -0,0 +1,37 @@
+import os
+import sys
+
+import geopandas as gpd
+from shapely.geometry import Point
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from automation_for_app import ShapefileCache
+
+
+def _write_layer(tmp_path):
+    path = str(tmp_path / "OUT_Closures.shp")
+    gpd.GeoDataFrame(
+        {"A": [1, 2, 3]},
+        geometry=[Point(0, 0), Point(1, 1), Point(2, 2)],
+        crs="EPSG:3857"
+    ).to_file(path)
+    return path
+
+
+def test_missing_column_read_keeps_cached_rows(tmp_path):
+    path = _write_layer(tmp_path)
+    cache = ShapefileCache()
+
+    assert len(cache.read(path, ["A"])) == 3
+    assert "ZZZ" not in cache.read(path, ["ZZZ"]).columns
+    assert cache.read(path, ["A"])["A"].tolist() == [1, 2, 3]
+
+
+def test_missing_column_read_first_then_real_columns(tmp_path):
+    path = _write_layer(tmp_path)
+    cache = ShapefileCache()
+
+    cache.read(path, ["ZZZ"])
+    assert cache.read(path, ["A"])["A"].tolist() == [1, 2, 3]
+    assert len(cache.read(path, ["A"], geometry=True).geometry) == 3
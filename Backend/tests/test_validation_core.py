@@ -0,0 +1,47 @@
+import io
+import os
+import shutil
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation_core import extract_zip_from_bytes
+
+
+def _zip(names):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zip_ref:
+        for name in names:
+            zip_ref.writestr(name, b'data')
+    return buffer.getvalue()
+
+
+def test_project_wrapped_in_skipped_folder_is_found():
+    data = _zip([
+        'Temp/MRO_A/output/OUT_Closures.shp',
+        'Temp/MRO_A/output/OUT_Splices.shp',
+        'Temp/MRO_A/input/source.shp',
+    ])
+
+    workspace, extract_dir = extract_zip_from_bytes(data)
+    try:
+        assert workspace is not None
+        assert os.path.isfile(os.path.join(workspace, 'OUT_Closures.shp'))
+        assert os.path.isfile(os.path.join(workspace, 'OUT_Splices.shp'))
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+
+
+def test_skipped_subfolder_below_project_is_ignored():
+    data = _zip([
+        'MRO_A/output/OUT_Closures.shp',
+        'MRO_A/temp/OUT_Closures.shp',
+    ])
+
+    workspace, extract_dir = extract_zip_from_bytes(data)
+    try:
+        assert workspace.replace(os.sep, '/').endswith('MRO_A/output')
+        assert not os.path.exists(os.path.join(extract_dir, 'MRO_A', 'temp'))
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
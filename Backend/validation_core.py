@@ -0,0 +1,334 @@
+import os
+import zipfile
+import posixpath
+import tempfile
+import shutil
+import threading
+import atexit
+import io
+import hashlib
+import uuid
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Reduced file size limit for serverless environment
+MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB (Vercel has limits)
+
+# Maximum size of the extracted output folder, to guard against ZIP bombs
+MAX_UNCOMPRESSED_SIZE = 200 * 1024 * 1024  # 200MB
+
+class ArchiveTooLarge(ValueError):
+    """Raised when a ZIP's output folder would extract to more than MAX_UNCOMPRESSED_SIZE"""
+
+# Maximum number of lines and folder depth in the debug tree shown when no output folder is found
+MAX_TREE_LINES = 200
+MAX_TREE_DEPTH = 6
+
+# Checks run when the request doesn't select any
+DEFAULT_CHECKS = (
+    "OSC Duplicates Check",
+    "Cluster Overlap Check",
+    "Cable Granularity Check",
+    "Non-virtual Closure Validation",
+    "Point Location Validation",
+    "Cable Diameter Validation",
+    "Cable Reference Validation",
+    "Shapefile Processing",
+    "GISTOOL_ID Validation",
+    "Splice Count Report"
+)
+
+# Mapping of check names to functions, built once by get_check_functions()
+_CHECK_FUNCTIONS = None
+
+def get_check_functions():
+    """Return the check name to function mapping, importing the validators on first use"""
+    global _CHECK_FUNCTIONS
+    if _CHECK_FUNCTIONS is None:
+        # Validators pull in geopandas, so they're only imported once a check runs
+        from automation_for_app import (
+            check_osc_duplicates, check_invalid_cable_refs,
+            report_splice_counts_by_closure, process_shapefiles,
+            check_gistool_id, check_cluster_overlaps, check_granularity_fields, 
+            validate_non_virtual_closures, validate_feeder_primdistribution_locations,
+            validate_cable_diameters
+        )
+        
+        _CHECK_FUNCTIONS = {
+            "OSC Duplicates Check": check_osc_duplicates,
+            "Cluster Overlap Check": check_cluster_overlaps,
+            "Cable Granularity Check": check_granularity_fields,
+            "Non-virtual Closure Validation": validate_non_virtual_closures,
+            "Point Location Validation": validate_feeder_primdistribution_locations,
+            "Cable Diameter Validation": validate_cable_diameters,
+            "Cable Reference Validation": check_invalid_cable_refs,
+            "Shapefile Processing": process_shapefiles,
+            "GISTOOL_ID Validation": check_gistool_id,
+            "Splice Count Report": report_splice_counts_by_closure
+        }
+    return _CHECK_FUNCTIONS
+
+def preload_validators():
+    """Import the validators and register GDAL's drivers ahead of the first request"""
+    get_check_functions()
+    import pyogrio
+    pyogrio.list_drivers()
+
+def use_zlib_ng():
+    """Make zipfile inflate and CRC-check with zlib-ng when it's installed.
+    
+    zipfile reaches zlib through two module globals, so this affects every zipfile
+    user in the process; only the app entry points call it. Returns True if zlib-ng
+    is now in use.
+    """
+    try:
+        # zlib-ng is a drop-in zlib with SIMD CRC32 and inflate
+        from zlib_ng import zlib_ng
+    except ImportError:
+        return False
+    zipfile.zlib = zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
+    return True
+
+# Folders that never hold the Comsof output (VCS and macOS metadata, Comsof inputs and scratch)
+_SKIP_DIRS = frozenset({'.git', '__macosx', 'input', 'temp'})
+
+def _is_skipped(name):
+    """Return True for ZIP entries inside one of the _SKIP_DIRS folders"""
+    return not _SKIP_DIRS.isdisjoint(name.lower().split('/')[:-1])
+
+def _is_output_member(name):
+    """Return True for ZIP entries inside an output folder or named OUT_*"""
+    parts = name.lower().split('/')
+    return 'output' in parts[:-1] or parts[-1].startswith('out_')
+
+def zip_source(zip_data):
+    """Return a file object for ZIP data given as bytes or an already open file"""
+    if isinstance(zip_data, (bytes, bytearray)):
+        return io.BytesIO(zip_data)
+    return zip_data
+
+def payload_size(data):
+    """Return the size in bytes of an upload held as bytes or a seekable file"""
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    size = data.seek(0, os.SEEK_END)
+    data.seek(0)
+    return size
+
+def archive_tree(zip_data, max_lines=MAX_TREE_LINES, max_depth=MAX_TREE_DEPTH):
+    """Render an indented listing of the ZIP entries for error messages, capped at max_lines and max_depth"""
+    with zipfile.ZipFile(zip_source(zip_data), 'r') as zip_ref:
+        names = sorted(zip_ref.namelist())
+    
+    buf = io.StringIO()
+    lines = 0
+    seen_dirs = set()
+    for name in names:
+        parts = name.rstrip('/').split('/')
+        is_dir = name.endswith('/')
+        # Emit parent folders the first time they appear, then the entry itself;
+        # anything deeper than max_depth is left out
+        for level, part in enumerate(parts[:max_depth]):
+            path = '/'.join(parts[:level + 1])
+            if level < len(parts) - 1 or is_dir:
+                if path in seen_dirs:
+                    continue
+                seen_dirs.add(path)
+                part += '/'
+            if lines == max_lines:
+                buf.write('... (truncated)')
+                return buf.getvalue()
+            buf.write(f"{' ' * 4 * level}{part}\n")
+            lines += 1
+    return buf.getvalue().rstrip('\n')
+
+# Scratch folders untouched for this long were left behind by processes that died
+STALE_SCRATCH_AGE = 6 * 60 * 60  # 6 hours
+
+def _sweep_stale_scratch():
+    """Remove comsof_* scratch folders that crashed or killed processes left in the temp directory"""
+    cutoff = time.time() - STALE_SCRATCH_AGE
+    try:
+        with os.scandir(tempfile.gettempdir()) as entries:
+            for entry in entries:
+                if (entry.name.startswith('comsof_') and entry.is_dir(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+    except OSError:
+        pass
+
+_sweep_stale_scratch()
+
+# Per-process scratch directory; each request extracts into its own subfolder
+_SCRATCH = tempfile.mkdtemp(prefix='comsof_')
+_SCRATCH_PID = os.getpid()
+
+# Extract directories still being removed by a background cleanup thread
+_pending_cleanup = set()
+_pending_lock = threading.Lock()
+
+def _remove_dir(path):
+    shutil.rmtree(path, ignore_errors=True)
+    with _pending_lock:
+        _pending_cleanup.discard(path)
+
+def cleanup_async(path):
+    """Remove path on a background thread so the response isn't held up by the delete"""
+    with _pending_lock:
+        _pending_cleanup.add(path)
+    threading.Thread(target=_remove_dir, args=(path,), daemon=True).start()
+
+@atexit.register
+def _cleanup_pending():
+    # The process that created the scratch folder removes it whole; forked
+    # workers share it, so they only finish the deletes their daemon threads
+    # didn't get to before the interpreter stopped them
+    if os.getpid() == _SCRATCH_PID:
+        shutil.rmtree(_SCRATCH, ignore_errors=True)
+        return
+    with _pending_lock:
+        paths = list(_pending_cleanup)
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+# Number of recent uploads whose check results are kept for repeat validations
+MAX_CACHED_UPLOADS = 32
+
+# Check results per upload, keyed by a digest of the ZIP bytes, oldest first
+_results_cache = OrderedDict()
+_results_lock = threading.Lock()
+
+def upload_digest(data):
+    """Return a BLAKE2b digest of an upload held as bytes or a seekable file"""
+    if isinstance(data, (bytes, bytearray)):
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in iter(lambda: data.read(1024 * 1024), b''):
+        digest.update(chunk)
+    data.seek(0)
+    return digest.hexdigest()
+
+def get_cached_results(digest, check_names):
+    """Return cached results for every check in check_names, or None if any is missing"""
+    with _results_lock:
+        cached = _results_cache.get(digest)
+        if cached is None or not all(name in cached for name in check_names):
+            return None
+        _results_cache.move_to_end(digest)
+        return [[name, *cached[name]] for name in check_names]
+
+def cache_results(digest, completed):
+    """Remember the (status, message) of checks that ran to completion for an upload"""
+    with _results_lock:
+        _results_cache.setdefault(digest, {}).update(completed)
+        _results_cache.move_to_end(digest)
+        while len(_results_cache) > MAX_CACHED_UPLOADS:
+            _results_cache.popitem(last=False)
+
+def _closures_dir(infos):
+    """Return the ZIP path of the folder holding OUT_Closures.shp, or None without one"""
+    return next(
+        (posixpath.dirname(info.filename) for info in infos
+         if posixpath.basename(info.filename) == 'OUT_Closures.shp'),
+        None
+    )
+
+def _find_workspace(infos, closures_dir):
+    """Return the ZIP path of the folder holding the output shapefiles"""
+    names = [info.filename for info in infos if _is_output_member(info.filename)]
+    
+    # 1. Prefer an MRO_* top-level folder, otherwise the archive root
+    top_dirs = sorted({name.split('/', 1)[0] for name in names if '/' in name})
+    base_dir = next((name for name in top_dirs if name.startswith('MRO_')), '')
+    
+    # 2. Use its output folder when the archive has one
+    output_dir = posixpath.join(base_dir, 'output')
+    if any(name.startswith(output_dir + '/') for name in names):
+        return output_dir
+    
+    # 3. Fallback: the folder containing OUT_Closures.shp
+    return closures_dir
+
+def extract_zip_from_bytes(zip_data):
+    """Extract zip file from bytes data or a file object and find the output directory.
+    
+    Nothing is written to disk unless the archive holds an OUT_Closures.shp to validate;
+    otherwise (None, None) is returned.
+    """
+    # Extract zip file straight from memory or the spooled upload
+    with zipfile.ZipFile(zip_source(zip_data), 'r') as zip_ref:
+        # The ZIP index already tells us which folder holds OUT_Closures.shp;
+        # without it there is nothing to validate, so skip extraction entirely
+        all_infos = zip_ref.infolist()
+        infos = [info for info in all_infos if not _is_skipped(info.filename)]
+        closures_dir = _closures_dir(infos)
+        if closures_dir is None and len(infos) < len(all_infos):
+            # A skipped folder name can also wrap the whole project (e.g. Temp/MRO_A/...),
+            # so look through the unfiltered index before giving up
+            infos = all_infos
+            closures_dir = _closures_dir(infos)
+        if closures_dir is None:
+            return None, None
+        
+        # Work out the output folder from the ZIP index, then only extract
+        # the output files under it and refuse ZIP bombs
+        workspace = _find_workspace(infos, closures_dir)
+        prefix = workspace + '/' if workspace else ''
+        members = [
+            info for info in infos
+            if info.filename.startswith(prefix) and _is_output_member(info.filename)
+        ]
+        if sum(info.file_size for info in members) > MAX_UNCOMPRESSED_SIZE:
+            raise ArchiveTooLarge(
+                f'Uncompressed output folder exceeds {MAX_UNCOMPRESSED_SIZE // (1024*1024)}MB'
+            )
+        
+        # Create a uniquely named folder in the process scratch directory
+        extract_dir = os.path.join(_SCRATCH, uuid.uuid4().hex)
+        try:
+            os.mkdir(extract_dir)
+        except FileNotFoundError:
+            # An idle process's scratch folder can look stale to another process's sweep
+            os.makedirs(extract_dir)
+        try:
+            zip_ref.extractall(extract_dir, members=members)
+        except Exception as e:
+            # Clean up on error
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            raise e
+    
+    return os.path.normpath(os.path.join(extract_dir, workspace)), extract_dir
+
+def run_checks(workspace, check_names):
+    """Run the named checks on workspace in parallel, since they only read it.
+    
+    Returns the [name, status, message] results in the order given, and the
+    (status, message) of each check that ran to completion, keyed by name.
+    """
+    check_functions = get_check_functions()
+    from automation_for_app import ShapefileCache
+    # Shared by every check in this run so common layers are read from disk once
+    cache = ShapefileCache()
+    results = []
+    completed = {}
+    max_workers = min(len(check_names), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (check_name, executor.submit(check_functions[check_name], workspace, cache=cache)
+             if check_name in check_functions else None)
+            for check_name in check_names
+        ]
+        # Collect in submission order so results match the selected order
+        for check_name, future in futures:
+            if future is None:
+                results.append([check_name, None, "Check function not found"])
+                continue
+            try:
+                status, message = future.result()
+                results.append([check_name, status, message])
+                completed[check_name] = (status, message)
+            except Exception as e:
+                results.append([check_name, None, f"Error running check: {str(e)}"])
+    return results, completed
@@ -1,14 +1,155 @@
 import geopandas as gpd
 import sys
 import os
+import functools
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from pandas.api.types import is_integer_dtype
+
+try:
+    import pyogrio  # noqa: F401 - lets read_file skip unused columns and geometry
+    _HAS_PYOGRIO = True
+    gpd.options.io_engine = "pyogrio"
+except ImportError:
+    _HAS_PYOGRIO = False
+
+try:
+    import pyarrow  # noqa: F401 - only needed for pyogrio's Arrow read path
+    _USE_ARROW = _HAS_PYOGRIO
+except ImportError:
+    _USE_ARROW = False
 
 __all__ = ['check_osc_duplicates', 'check_invalid_cable_refs', 'report_splice_counts_by_closure', 'process_shapefiles', 'check_gistool_id', 'check_cluster_overlaps', 
            'check_granularity_fields', 'validate_non_virtual_closures', 'validate_feeder_primdistribution_locations', 'validate_cable_diameters']
+
+
+def _file_stamp(path):
+    """
+    Returns (mtime, size) of a shapefile and of its .dbf, which attribute-only
+    edits touch without changing the .shp
+    """
+    stamp = []
+    for part in (path, os.path.splitext(path)[0] + ".dbf"):
+        try:
+            stat = os.stat(part)
+        except OSError:
+            continue
+        stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+@functools.lru_cache(maxsize=64)
+def _read_cached(path, stamp, columns, geometry):
+    """
+    Reads a shapefile once per (path, file stamp, columns, geometry), so checks run
+    back-to-back on one workspace share the parse. Only _read() calls it, and hands
+    out copies; _read_cached.cache_clear() drops every entry.
+    """
+    if not _HAS_PYOGRIO:
+        return gpd.read_file(path)
+    return gpd.read_file(path, engine="pyogrio", use_arrow=_USE_ARROW,
+                         columns=None if columns is None else list(columns),
+                         read_geometry=geometry)
+
+def _read(path, columns=None, geometry=True):
+    """
+    Reads a shapefile through pyogrio's Arrow path, limited to the given attribute
+    columns (all when None) and optionally without geometry.
+    Falls back to a full read when pyogrio isn't installed.
+    Returns a copy of the cached frame, so callers are free to modify it.
+    """
+    path = os.path.abspath(path)
+    frame = _read_cached(path, _file_stamp(path), None if columns is None else tuple(columns), geometry)
+    # A deep copy, since without copy-on-write a shallow one still shares the
+    # column data with the cache and an in-place assignment would leak into it
+    return frame.copy()
+
+def _read_columns(path, columns):
+    """Reads only the given attribute columns of a shapefile, without geometry"""
+    return _read(path, columns, geometry=False)
+
+def _map_layers(check_layer, layers):
+    """
+    Runs check_layer on every layer in its own thread and yields the results in layer order.
+    Reads and GEOS predicates release the GIL, so independent layers overlap.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(layers), 1)) as executor:
+        yield from executor.map(check_layer, layers)
+
+
+@functools.lru_cache(maxsize=16)
+def _cable_id_index(path, stamp):
+    """
+    Unique CABLE_IDs of one version of a cable file, keyed like _read_cached so
+    re-running the checks on an unchanged workspace reuses the index and its hashtable
+    """
+    return pd.Index(_read_columns(path, ["CABLE_ID"])["CABLE_ID"].to_numpy()).unique()
+
+def _cable_ids(path):
+    """Return the unique CABLE_IDs of a cable shapefile as a pandas Index"""
+    path = os.path.abspath(path)
+    return _cable_id_index(path, _file_stamp(path))
+
 #########################################################################
 #######################check_invalid_cable_refs##########################
 #########################################################################
 
+def _in_dense_range(valid_ids, ids):
+    """
+    Tells whether the unique integer valid_ids are every value from their min to
+    their max and all of ids fall inside that range, which makes every id valid.
+    """
+    if not (np.issubdtype(valid_ids.dtype, np.integer) and np.issubdtype(ids.dtype, np.integer)):
+        return False
+    if not len(valid_ids) or not len(ids):
+        return False
+    low, high = int(valid_ids.min()), int(valid_ids.max())
+    return high - low + 1 == len(valid_ids) and ids.min() >= low and ids.max() <= high
+
+def _list_files(workspace):
+    """Return the names of the files in workspace from one directory scan"""
+    try:
+        with os.scandir(workspace) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+def _check_cable_refs_layer(workspace, layer, present):
+    """Checks one cable type's pieces and returns the lines to print"""
+    cable_file = f"OUT_{layer}Cables.shp"
+    piece_file = f"OUT_{layer}CablePieces.shp"
+
+    if cable_file not in present:
+        return [f"⚠️ Cable file missing: {cable_file}"]
+    if piece_file not in present:
+        return [f"⚠️ Cable piece file missing: {piece_file}"]
+
+    cable_path = os.path.join(workspace, cable_file)
+    piece_path = os.path.join(workspace, piece_file)
+
+    # Load shapefiles
+    valid_ids = _cable_ids(cable_path)
+    pieces = _read_columns(piece_path, ["CABLE_ID"])
+
+    # Check for invalid CableID references. When the cable IDs are a gapless
+    # integer range, a min/max comparison settles it without hashing; otherwise
+    # pieces whose ID isn't in the cable index get -1
+    piece_ids = pieces["CABLE_ID"].to_numpy()
+    if _in_dense_range(valid_ids, piece_ids):
+        invalid_pieces = pieces.iloc[:0]
+    else:
+        invalid_pieces = pieces.loc[valid_ids.get_indexer(piece_ids) == -1, ["CABLE_ID"]]
+
+    if invalid_pieces.empty:
+        output = [f"✅ {layer}CablePieces: All CABLE_IDs are valid."]
+    else:
+        output = [
+            f"❌ {layer}CablePieces: Found {len(invalid_pieces)} invalid CableID references.",
+            invalid_pieces.drop_duplicates().to_string(index=False)
+        ]
+    output.append("-" * 60)
+    return output
+
 def check_invalid_cable_refs(workspace):
     """
     Checks all cable piece shapefiles against their corresponding cable shapefiles
@@ -30,34 +171,13 @@ def check_invalid_cable_refs(workspace):
 
     print(f"🔍 Checking CableID references in workspace:\n{workspace}\n")
 
-    for layer in cable_types:
-        cable_file = f"OUT_{layer}Cables.shp"
-        piece_file = f"OUT_{layer}CablePieces.shp"
-
-        cable_path = os.path.join(workspace, cable_file)
-        piece_path = os.path.join(workspace, piece_file)
+    # One directory scan answers every "is this file there" question below
+    present = _list_files(workspace)
 
-        if not os.path.exists(cable_path):
-            print(f"⚠️ Cable file missing: {cable_file}")
-            continue
-        if not os.path.exists(piece_path):
-            print(f"⚠️ Cable piece file missing: {piece_file}")
-            continue
-
-        # Load shapefiles
-        cables = gpd.read_file(cable_path)
-        pieces = gpd.read_file(piece_path)
-
-        # Check for invalid CableID references
-        valid_ids = set(cables["CABLE_ID"])
-        invalid_pieces = pieces[~pieces["CABLE_ID"].isin(valid_ids)]
-
-        if invalid_pieces.empty:
-            print(f"✅ {layer}CablePieces: All CABLE_IDs are valid.")
-        else:
-            print(f"❌ {layer}CablePieces: Found {len(invalid_pieces)} invalid CableID references.")
-            print(invalid_pieces[["CABLE_ID"]].drop_duplicates().to_string(index=False))
-        print("-" * 60)
+    # Each cable type reads its own pair of files, so they're checked in parallel;
+    # output is collected per type and printed in order
+    for lines in _map_layers(lambda layer: _check_cable_refs_layer(workspace, layer, present), cable_types):
+        print("\n".join(lines))
 
 #########################################################################
 ###########################check_osc_duplicates##########################
@@ -83,7 +203,7 @@ def check_osc_duplicates(workspace):
 
     try:
         # Read shapefile
-        gdf = gpd.read_file(shapefile_path)
+        gdf = _read_columns(shapefile_path, ["ID"])
     except Exception as e:
         print(f"⛔ Error reading shapefile: {e}")
         return None
@@ -93,15 +213,23 @@ def check_osc_duplicates(workspace):
         print("⛔ Error: 'ID' column not found in the shapefile")
         return None
 
-    # Check for duplicates
-    duplicates = gdf['ID'].duplicated(keep=False)
+    # One hashing pass: factorize gives each row its value's code and bincount
+    # the rows per value, with no per-row boolean mask
+    codes, uniques = pd.factorize(gdf['ID'].to_numpy(), use_na_sentinel=False)
+    counts = np.bincount(codes)
+    duplicated_values = counts > 1
     
-    if duplicates.any():
+    if duplicated_values.any():
         print("\n⚠️  We have a problem of duplicated OSCs! ⚠️")
-        print(f"Total duplicated entries: {duplicates.sum()}")
+        print(f"Total duplicated entries: {int(counts[duplicated_values].sum())}")
         
-        duplicates_df = gdf[duplicates]['ID'].value_counts().reset_index()
-        duplicates_df.columns = ['OSC Value', 'Duplicate Count']
+        duplicates_df = pd.DataFrame({
+            'OSC Value': uniques[duplicated_values],
+            'Duplicate Count': counts[duplicated_values]
+        })
+        # Missing IDs count towards the total but aren't listed
+        duplicates_df = duplicates_df[duplicates_df['OSC Value'].notna()]
+        duplicates_df = duplicates_df.sort_values('Duplicate Count', ascending=False, kind='stable')
         
         print("\nDuplicate occurrences:")
         print(duplicates_df.to_string(index=False))
@@ -138,19 +266,25 @@ def report_splice_counts_by_closure(workspace):
         return
 
     # Load shapefiles
-    closures = gpd.read_file(closure_file)
-    splices = gpd.read_file(splice_file)
-
-    # Count splices per closure ID
-    splice_counts = splices["ID"].value_counts().reset_index()
-    splice_counts.columns = ["ID", "SpliceCount"]
-
-    # Merge counts into closures
-    closures["ID"] = closures["ID"].astype(str)
-    splice_counts["ID"] = splice_counts["ID"].astype(str)
-    report_df = closures[["IDENTIFIER", "ID"]].copy()
-    report_df = report_df.merge(splice_counts, on="ID", how="left")
-    report_df["SpliceCount"] = report_df["SpliceCount"].fillna(0).astype(int)
+    closures = _read_columns(closure_file, ["IDENTIFIER", "ID"])
+    splices = _read_columns(splice_file, ["ID"])
+
+    # Integer IDs are matched as they are; anything else is matched on its
+    # text form so IDs stored with different field types still line up
+    closure_ids = closures["ID"]
+    splice_ids = splices["ID"].dropna()
+    if not (is_integer_dtype(closure_ids) and is_integer_dtype(splice_ids)):
+        closure_ids = closure_ids.astype(str)
+        splice_ids = splice_ids.astype(str)
+
+    # Count splices per closure ID and look the count up for every closure;
+    # the counts are unique per ID, so a map does what a left merge would
+    splice_counts = splice_ids.value_counts()
+    report_df = pd.DataFrame({
+        "IDENTIFIER": closures["IDENTIFIER"],
+        "ID": closure_ids,
+        "SpliceCount": closure_ids.map(splice_counts).fillna(0).astype(int)
+    })
 
     # Sort and print
     report_df.sort_values(by="SpliceCount", ascending=False, inplace=True)
@@ -158,11 +292,16 @@ def report_splice_counts_by_closure(workspace):
     print(f"{'Closure Type (IDENTIFIER)':<30} {'Closure ID (ID)':<20} {'# Splices':<10}")
     print("-" * 65)
 
-    for _, row in report_df.iterrows():
-        identifier = row['IDENTIFIER'] if pd.notnull(row['IDENTIFIER']) else 'N/A'
-        closure_id = str(row['ID']) if pd.notnull(row['ID']) else 'N/A'
-        splice_count = row['SpliceCount']
-        print(f"{identifier:<30} {closure_id:<20} {splice_count:<10}")
+    # Format the rows from plain column lists and print them in one call;
+    # iterrows would build a Series for every closure
+    rows = zip(
+        report_df['IDENTIFIER'].fillna('N/A').tolist(),
+        report_df['ID'].fillna('N/A').astype(str).tolist(),
+        report_df['SpliceCount'].tolist()
+    )
+    lines = [f"{identifier:<30} {closure_id:<20} {splice_count:<10}" for identifier, closure_id, splice_count in rows]
+    if lines:
+        print("\n".join(lines))
 
     print("\n✅ Report complete.\n")
 
@@ -193,23 +332,25 @@ def process_shapefiles(workspace):
             print(f"⛔ Error: OUT_FeederCables.shp not found in {workspace}")
             return None
         
-        feeder_gdf = gpd.read_file(feeder_path)
+        # Decide from the IDENTIFIER column alone; only a rewrite needs every field
+        identifiers = _read_columns(feeder_path, ["IDENTIFIER"])
         
-        # Create IDENTIFIER column if missing
-        if 'IDENTIFIER' not in feeder_gdf.columns:
-            feeder_gdf['IDENTIFIER'] = "Breakout"
+        if 'IDENTIFIER' not in identifiers.columns:
+            mask = None
             modified = True
         else:
-            # Fill empty values in existing IDENTIFIER column
-            mask = feeder_gdf['IDENTIFIER'].isna() | (feeder_gdf['IDENTIFIER'] == '')
-            if mask.any():
-                feeder_gdf.loc[mask, 'IDENTIFIER'] = "Breakout"
-                modified = True
-            else:
-                modified = False
+            mask = identifiers['IDENTIFIER'].isna() | (identifiers['IDENTIFIER'] == '')
+            modified = bool(mask.any())
         
         # Save changes if any modifications were made
         if modified:
+            feeder_gdf = _read(feeder_path)
+            if mask is None:
+                # Create IDENTIFIER column if missing
+                feeder_gdf['IDENTIFIER'] = "Breakout"
+            else:
+                # Fill empty values in existing IDENTIFIER column
+                feeder_gdf.loc[mask.to_numpy(), 'IDENTIFIER'] = "Breakout"
             feeder_gdf.to_file(feeder_path, driver='ESRI Shapefile')
             print("✅ Feeder cables: IDENTIFIER column has been updated with 'Breakout' values")
         else:
@@ -224,7 +365,7 @@ def process_shapefiles(workspace):
             print(f"⛔ Error: OUT_Closures.shp not found in {workspace}")
             return None
         
-        closures_gdf = gpd.read_file(closures_path)
+        closures_gdf = _read_columns(closures_path, ["IDENTIFIER", "VIRTUAL"])
         errors_found = False
         
         # Check for required columns
@@ -281,7 +422,7 @@ def check_gistool_id(workspace):
             return None
         
         # Read shapefile
-        seg_gdf = gpd.read_file(seg_path)
+        seg_gdf = _read_columns(seg_path, ["TYPE", "GISTOOL_ID", "ID"])
         
         # Check for required columns
         required_cols = ['TYPE', 'GISTOOL_ID', 'ID']
@@ -324,6 +465,44 @@ def check_gistool_id(workspace):
 ########################## check_cluster_overlaps #############################
 #########################################################################
 
+def _check_cluster_overlaps_layer(workspace, file):
+    """Checks one cluster shapefile for overlaps and returns the lines to print"""
+    path = os.path.join(workspace, file)
+
+    if not os.path.isfile(path):
+        return [f"⚠️ File not found: {file}"]
+
+    output = []
+    try:
+        gdf = _read(path, ["CAB_GROUP", "AGG_ID"])
+        gdf = gdf[gdf.geometry.notnull()].reset_index(drop=True)
+
+        # One bulk spatial index query tests every feature at once; keeping
+        # left < right drops self-matches and reports each pair once
+        left, right = gdf.sindex.query(gdf.geometry, predicate="intersects")
+        mask = left < right
+        left, right = left[mask], right[mask]
+
+        if len(left):
+            output.append(f"❌ {file}: {len(left)} overlaps found:")
+            # Pull the ID column out once; rows without it are named by position
+            id_field = "CAB_GROUP" if "CableClusters" in file else "AGG_ID"
+            ids = gdf[id_field].to_numpy() if id_field in gdf.columns else None
+            for a, b in zip(left[:5].tolist(), right[:5].tolist()):  # show only first 5
+                id_a = ids[a] if ids is not None else a
+                id_b = ids[b] if ids is not None else b
+                if id_field == "CAB_GROUP":
+                    output.append(f"   • Cluster CAB_GROUP {id_a} overlaps with CAB_GROUP {id_b}")
+                else:
+                    output.append(f"   • Cluster AGG_ID {id_a} overlaps with Cluster AGG_ID {id_b}")
+        else:
+            output.append(f"✅ {file}: No overlaps detected.")
+
+    except Exception as e:
+        output.append(f"⛔ Error processing {file}: {e}")
+
+    return output
+
 def check_cluster_overlaps(workspace, cluster_files=None):
     """
     Detects overlapping features within each cluster layer shapefile.
@@ -353,46 +532,39 @@ def check_cluster_overlaps(workspace, cluster_files=None):
 
     print("\n🔍 Running cluster self-overlap checks...\n")
 
-    for file in cluster_files:
-        path = os.path.join(workspace, file)
-
-        if not os.path.isfile(path):
-            print(f"⚠️ File not found: {file}")
-            continue
-
-        try:
-            gdf = gpd.read_file(path)
-            gdf = gdf[gdf.geometry.notnull()].reset_index(drop=True)
-
-            # Use spatial index to efficiently detect intersections
-            overlaps = []
-            for idx, geom in gdf.geometry.items():
-                candidates = gdf.sindex.query(geom, predicate="intersects")
-                for j in candidates:
-                    if idx < j and geom.intersects(gdf.geometry[j]):
-                        overlaps.append((idx, j))
-
-            if overlaps:
-                print(f"❌ {file}: {len(overlaps)} overlaps found:")
-                for a, b in overlaps[:5]:  # show only first 5
-                    if "CableClusters" in file:
-                        id_a = gdf.loc[a].get("CAB_GROUP", a)
-                        id_b = gdf.loc[b].get("CAB_GROUP", b)
-                        print(f"   • Cluster CAB_GROUP {id_a} overlaps with CAB_GROUP {id_b}")
-                    else:
-                        id_a = gdf.loc[a].get("AGG_ID", a)
-                        id_b = gdf.loc[b].get("AGG_ID", b)
-                        print(f"   • Cluster AGG_ID {id_a} overlaps with Cluster AGG_ID {id_b}")
-            else:
-                print(f"✅ {file}: No overlaps detected.")
-
-        except Exception as e:
-            print(f"⛔ Error processing {file}: {e}")
+    # Every cluster layer is its own file, so they're read and checked in
+    # parallel; output is collected per file and printed in order
+    for lines in _map_layers(lambda file: _check_cluster_overlaps_layer(workspace, file), cluster_files):
+        print("\n".join(lines))
 
 #################################################################################
 ########################## check_granularity_fields #############################
 #################################################################################
 
+def _check_granularity_layer(workspace, layer):
+    """Checks one cable layer's granularity fields and returns the lines to print"""
+    file_path = os.path.join(workspace, f"OUT_{layer}Cables.shp")
+
+    if not os.path.exists(file_path):
+        return [f"⚠️ Missing: OUT_{layer}Cables.shp"]
+
+    try:
+        gdf = _read_columns(file_path, ["CABLE_ID", "CABLEGRAN", "BUNDLEGRAN"])
+        if 'CABLEGRAN' not in gdf.columns or 'BUNDLEGRAN' not in gdf.columns:
+            return [f"❌ {file_path} is missing required fields CABLEGRAN or BUNDLEGRAN."]
+
+        invalid_rows = gdf[(gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1)]
+
+        if not invalid_rows.empty:
+            return [
+                f"❌ Found {len(invalid_rows)} invalid rows in OUT_{layer}Cables.shp",
+                invalid_rows[['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN']].head(5).to_string(index=False)
+            ]
+        return [f"✅ OUT_{layer}Cables.shp: All granularity values are valid."]
+
+    except Exception as e:
+        return [f"⛔ Error reading {file_path}: {e}"]
+
 def check_granularity_fields(workspace):
     """
     Validates that CABLEGRAN and BUNDLEGRAN fields are not set to -1 
@@ -411,29 +583,10 @@ def check_granularity_fields(workspace):
 
     print("\n🔍 Checking CABLEGRAN and BUNDLEGRAN values in cable layers...\n")
 
-    for layer in cable_layers:
-        file_path = os.path.join(workspace, f"OUT_{layer}Cables.shp")
-
-        if not os.path.exists(file_path):
-            print(f"⚠️ Missing: OUT_{layer}Cables.shp")
-            continue
-
-        try:
-            gdf = gpd.read_file(file_path)
-            if 'CABLEGRAN' not in gdf.columns or 'BUNDLEGRAN' not in gdf.columns:
-                print(f"❌ {file_path} is missing required fields CABLEGRAN or BUNDLEGRAN.")
-                continue
-
-            invalid_rows = gdf[(gdf['CABLEGRAN'] == -1) | (gdf['BUNDLEGRAN'] == -1)]
-
-            if not invalid_rows.empty:
-                print(f"❌ Found {len(invalid_rows)} invalid rows in OUT_{layer}Cables.shp")
-                print(invalid_rows[['CABLE_ID', 'CABLEGRAN', 'BUNDLEGRAN']].head(5).to_string(index=False))
-            else:
-                print(f"✅ OUT_{layer}Cables.shp: All granularity values are valid.")
-
-        except Exception as e:
-            print(f"⛔ Error reading {file_path}: {e}")
+    # Each layer is its own file, so they're read and checked in parallel;
+    # output is collected per layer and printed in order
+    for lines in _map_layers(lambda layer: _check_granularity_layer(workspace, layer), cable_layers):
+        print("\n".join(lines))
 
 
 
@@ -457,7 +610,7 @@ def validate_non_virtual_closures(workspace):
         return
 
     try:
-        closures = gpd.read_file(closure_path)
+        closures = _read_columns(closure_path, ["ID", "LAYER", "VIRTUAL"])
 
         # Check required columns
         required_cols = ['LAYER', 'VIRTUAL']
@@ -528,8 +681,8 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
         return
     try:
         # Load shapefiles
-        feeder_points = gpd.read_file(feeder_path)
-        prim_points = gpd.read_file(prim_path)
+        feeder_points = _read(feeder_path, [])
+        prim_points = _read(prim_path, [])
 
         # Check if each file has exactly one point
         if len(feeder_points) != 1:
@@ -573,6 +726,34 @@ def validate_feeder_primdistribution_locations(workspace, tolerance=0.01):
 import os
 import geopandas as gpd
 
+def _check_diameters_layer(workspace, file):
+    """Checks one cable file's diameters; returns (lines to print, has_errors)"""
+    file_path = os.path.join(workspace, file)
+
+    if not os.path.exists(file_path):
+        return [f"⛔ Error: {file} not found in workspace"], True
+
+    gdf = _read_columns(file_path, ["CABLE_ID", "DIAMETER"])
+
+    if 'DIAMETER' not in gdf.columns:
+        return [f"⛔ Error: {file} is missing DIAMETER column"], True
+
+    # Find invalid diameters (missing or zero)
+    invalid_mask = gdf['DIAMETER'].isna() | (gdf['DIAMETER'] == 0)
+    invalid_cables = gdf[invalid_mask]
+
+    if invalid_cables.empty:
+        return [f"\n✅ {file}: All cables have valid diameters"], False
+
+    # Show sample of problematic cables
+    sample = invalid_cables[['CABLE_ID', 'DIAMETER']].head(5)
+    return [
+        f"\n❌ PROBLEM: Found {len(invalid_cables)} cables with invalid diameters in {file}",
+        "Cables must have non-zero diameter values",
+        "\nSample of problematic cables:",
+        sample.to_string(index=False)
+    ], True
+
 def validate_cable_diameters(workspace):
     """
     Validates that DIAMETER column is not empty or zero in cable shapefiles.
@@ -591,36 +772,10 @@ def validate_cable_diameters(workspace):
     try:
         any_errors = False
 
-        for file in cable_files:
-            file_path = os.path.join(workspace, file)
-
-            if not os.path.exists(file_path):
-                print(f"⛔ Error: {file} not found in workspace")
-                any_errors = True
-                continue
-
-            gdf = gpd.read_file(file_path)
-
-            if 'DIAMETER' not in gdf.columns:
-                print(f"⛔ Error: {file} is missing DIAMETER column")
-                any_errors = True
-                continue
-
-            # Find invalid diameters (missing or zero)
-            invalid_mask = gdf['DIAMETER'].isna() | (gdf['DIAMETER'] == 0)
-            invalid_cables = gdf[invalid_mask]
-
-            if not invalid_cables.empty:
-                any_errors = True
-                print(f"\n❌ PROBLEM: Found {len(invalid_cables)} cables with invalid diameters in {file}")
-                print("Cables must have non-zero diameter values")
-
-                # Show sample of problematic cables
-                sample = invalid_cables[['CABLE_ID', 'DIAMETER']].head(5)
-                print("\nSample of problematic cables:")
-                print(sample.to_string(index=False))
-            else:
-                print(f"\n✅ {file}: All cables have valid diameters")
+        # Each cable file is checked in its own thread; output is printed in file order
+        for lines, file_errors in _map_layers(lambda file: _check_diameters_layer(workspace, file), cable_files):
+            print("\n".join(lines))
+            any_errors = any_errors or file_errors
 
         if not any_errors:
             print("\n✅ All cable files have valid diameter values")